@@ -0,0 +1,189 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from __future__ import annotations
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from homeassistant.core import Event
+from homeassistant.helpers import device_registry, entity_registry
+from typing import Any, Callable, Iterator, Union
+import asyncio
+import inspect
+import random
+
+
+#-----------------------------------------------------------#
+#       Constants
+#-----------------------------------------------------------#
+
+DEVICE_CLASSES: dict[str, list[Union[str, None]]] = {
+    "binary_sensor": ["door", "motion", "occupancy", "window"],
+    "light": [None],
+    "media_player": ["speaker", "tv"],
+    "sensor": ["humidity", "illuminance", "power", "temperature"]
+}
+
+
+#-----------------------------------------------------------#
+#       Registry Stand-ins
+#-----------------------------------------------------------#
+
+@dataclass
+class StubRegistryEntry:
+    entity_id: str
+    area_id: Union[str, None] = None
+    config_entry_id: Union[str, None] = None
+    device_class: Union[str, None] = None
+    device_id: Union[str, None] = None
+    disabled_by: Union[str, None] = None
+    original_device_class: Union[str, None] = None
+
+    @property
+    def disabled(self) -> bool:
+        return self.disabled_by is not None
+
+
+@dataclass
+class StubDeviceEntry:
+    id: str
+    area_id: Union[str, None] = None
+
+
+@dataclass
+class StubEntityRegistry:
+    entities: dict[str, StubRegistryEntry] = field(default_factory=dict)
+
+    def async_get(self, entity_id: str) -> Union[StubRegistryEntry, None]:
+        return self.entities.get(entity_id, None)
+
+
+@dataclass
+class StubDeviceRegistry:
+    devices: dict[str, StubDeviceEntry] = field(default_factory=dict)
+
+    def async_get(self, device_id: str) -> Union[StubDeviceEntry, None]:
+        return self.devices.get(device_id, None)
+
+
+#-----------------------------------------------------------#
+#       HomeAssistant Stand-ins
+#-----------------------------------------------------------#
+
+@dataclass
+class StubConfigEntry:
+    entry_id: str
+    title: str
+    options: dict[str, Any]
+
+
+@dataclass
+class StubState:
+    entity_id: str
+    state: str
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+
+class StubStates:
+    def __init__(self):
+        self._states: dict[str, StubState] = {}
+
+    def async_set(self, entity_id: str, state: str, attributes: dict[str, Any] = None) -> None:
+        self._states[entity_id] = StubState(entity_id, state, attributes or {})
+
+    def get(self, entity_id: str) -> Union[StubState, None]:
+        return self._states.get(entity_id, None)
+
+
+class StubBus:
+    def __init__(self, hass: StubHomeAssistant):
+        self._hass: StubHomeAssistant = hass
+        self._listeners: dict[str, list[tuple[Callable, Union[Callable, None]]]] = {}
+
+    def async_fire(self, event_type: str, event_data: dict[str, Any]) -> None:
+        event = Event(event_type, event_data)
+
+        for listener, event_filter in list(self._listeners.get(event_type, [])):
+            if event_filter is None or event_filter(event):
+                self._hass.async_run_job(listener, event)
+
+    def async_listen(self, event_type: str, listener: Callable, event_filter: Callable = None) -> Callable[[], None]:
+        item = (listener, event_filter)
+        self._listeners.setdefault(event_type, []).append(item)
+        return lambda: self._listeners[event_type].remove(item)
+
+
+class StubHomeAssistant:
+    """ A lightweight stand-in for HomeAssistant, providing the states, bus, registries and loop helpers used by the registry. """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.bus: StubBus = StubBus(self)
+        self.data: dict[str, Any] = {}
+        self.device_registry: StubDeviceRegistry = StubDeviceRegistry()
+        self.entity_registry: StubEntityRegistry = StubEntityRegistry()
+        self.is_running: bool = True
+        self.loop: asyncio.AbstractEventLoop = loop
+        self.states: StubStates = StubStates()
+        self._tasks: set[asyncio.Task] = set()
+
+    def async_create_task(self, target: Any) -> asyncio.Task:
+        task = self.loop.create_task(target)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def async_run_hass_job(self, job: Any, *args: Any) -> None:
+        self.async_run_job(job.target, *args)
+
+    def async_run_job(self, target: Callable, *args: Any) -> None:
+        result = target(*args)
+
+        if inspect.iscoroutine(result):
+            self.async_create_task(result)
+
+    async def async_block_till_done(self) -> None:
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks))
+
+
+#-----------------------------------------------------------#
+#       Functions
+#-----------------------------------------------------------#
+
+@contextmanager
+def patch_registries() -> Iterator[None]:
+    """ Makes the entity- and device registry helpers return the stand-in registries of the stub. """
+    entity_registry_get, device_registry_get = entity_registry.async_get, device_registry.async_get
+    entity_registry.async_get = lambda hass: hass.entity_registry
+    device_registry.async_get = lambda hass: hass.device_registry
+
+    try:
+        yield
+    finally:
+        entity_registry.async_get, device_registry.async_get = entity_registry_get, device_registry_get
+
+
+def populate(hass: StubHomeAssistant, entity_count: int, area_count: int, seed: int = 0) -> list[str]:
+    """ Populates the stub with entities spread across areas. Half of the entities inherit their area from a device and about 1% is disabled. Returns the area ids. """
+    rng = random.Random(seed)
+    areas = [f"area_{index}" for index in range(area_count)]
+    domains = list(DEVICE_CLASSES.keys())
+
+    for index in range(entity_count):
+        domain = domains[index % len(domains)]
+        device_class = rng.choice(DEVICE_CLASSES[domain])
+        entity_id = f"{domain}.entity_{index}"
+        area_id = rng.choice(areas)
+        entry = StubRegistryEntry(entity_id, config_entry_id="stub", disabled_by="user" if rng.random() < 0.01 else None, original_device_class=device_class)
+
+        if index % 2 == 0:
+            device_id = f"device_{index // 4}"
+            device = hass.device_registry.devices.setdefault(device_id, StubDeviceEntry(device_id, area_id))
+            entry.device_id = device.id
+        else:
+            entry.area_id = area_id
+
+        hass.entity_registry.entities[entity_id] = entry
+        hass.states.async_set(entity_id, rng.choice(["on", "off"]) if domain != "sensor" else str(round(rng.uniform(0, 100), 2)), { "device_class": device_class } if device_class else {})
+
+    return areas
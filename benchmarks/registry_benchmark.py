@@ -0,0 +1,161 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Callable, Union
+import argparse
+import asyncio
+import gc
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from custom_components.matjak_areas.utils import registry as ma_registry
+from custom_components.matjak_areas.utils.slicer import MA_Slicer
+from hass_stub import patch_registries, populate, StubConfigEntry, StubHomeAssistant
+from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
+
+
+#-----------------------------------------------------------#
+#       Constants
+#-----------------------------------------------------------#
+
+SCENARIOS: dict[str, tuple[int, int]] = {
+    "1k": (1000, 50),
+    "10k": (10000, 200),
+    "50k": (50000, 500)
+}
+
+
+#-----------------------------------------------------------#
+#       Measuring
+#-----------------------------------------------------------#
+
+def measure(results: list[tuple[str, float, Union[float, None]]], name: str, function: Callable[[], Any], repeat: int = 1) -> Any:
+    """ Measures the average time and the peak memory of a function, appending the result. """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    for _ in range(repeat):
+        result = function()
+
+    elapsed = (time.perf_counter() - start) / repeat
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    results.append((name, elapsed * 1000, peak / 1024))
+    return result
+
+
+#-----------------------------------------------------------#
+#       Scenarios
+#-----------------------------------------------------------#
+
+async def async_run_scenario(entity_count: int, area_count: int, registry_count: int, areas_per_registry: int, storm_events: int) -> list[tuple[str, float, Union[float, None]]]:
+    """ Runs the registry benchmarks against a populated stand-in. """
+    hass = StubHomeAssistant(asyncio.get_running_loop())
+    areas = populate(hass, entity_count, area_count)
+    config_entries = [
+        StubConfigEntry(f"entry_{index}", f"Registry {index}", { "areas": [areas[(index * areas_per_registry + offset) % area_count] for offset in range(areas_per_registry)] })
+        for index in range(registry_count)
+    ]
+    results: list[tuple[str, float, Union[float, None]]] = []
+
+    measure(results, "MA_AreaIndex.build", lambda: ma_registry._area_index.build(hass))
+    ma_registry._registry_listener = ma_registry.setup_listeners(hass, quiet_period=0.05, max_wait=0.25)
+
+    def create_registries() -> None:
+        for config_entry in config_entries:
+            ma_registry.create_registry(hass, config_entry)
+
+    measure(results, f"MA_Registry.__init__ (x{registry_count})", create_registries)
+    registries = [ma_registry.get_registry(config_entry) for config_entry in config_entries]
+
+    measure(results, f"MA_Registry.update_entities (x{registry_count})", lambda: [registry.update_entities() for registry in registries])
+    measure(results, f"MA_Registry.get_entities domain+class (x{registry_count})", lambda: [registry.get_entities(["binary_sensor"], ["motion"]) for registry in registries], repeat=10)
+    measure(results, f"MA_Registry.get_entities domain (x{registry_count})", lambda: [registry.get_entities(["sensor"]) for registry in registries], repeat=10)
+    measure(results, f"MA_Registry.get_entities all (x{registry_count})", lambda: [registry.get_entities() for registry in registries], repeat=10)
+    await hass.async_block_till_done()
+
+    slicer = MA_Slicer(ma_registry.REBUILD_SLICE_TIME)
+    start = time.perf_counter()
+
+    for registry in registries:
+        await registry.async_update_entities(slicer)
+        await slicer.async_checkpoint()
+
+    slicer.finish()
+    results.append((f"MA_Registry.async_update_entities (x{registry_count}, {len(slicer.slice_times)} slices)", (time.perf_counter() - start) * 1000, None))
+    results.append((f"MA_Registry.async_update_entities longest slice", slicer.max_slice_time * 1000, None))
+    await hass.async_block_till_done()
+
+    entity_ids = list(hass.entity_registry.entities.keys())
+    debouncer = ma_registry.get_registry_debouncer()
+    reload_times: list[float] = []
+    async_reload = debouncer._function
+
+    async def async_timed_reload() -> None:
+        start = time.perf_counter()
+        await async_reload()
+        reload_times.append(time.perf_counter() - start)
+
+    debouncer._function = async_timed_reload
+    storm_start = time.perf_counter()
+
+    for index in range(storm_events):
+        entry = hass.entity_registry.entities[entity_ids[(index * 7919) % len(entity_ids)]]
+        old_area_id, entry.area_id = entry.area_id, areas[index % area_count]
+        hass.bus.async_fire(EVENT_ENTITY_REGISTRY_UPDATED, { "action": "update", "entity_id": entry.entity_id, "changes": { "area_id": old_area_id } })
+        await asyncio.sleep(0.005)
+
+    storm_elapsed = time.perf_counter() - storm_start
+
+    while debouncer.pending_calls > 0:
+        await asyncio.sleep(0.05)
+
+    await hass.async_block_till_done()
+    results.append((f"setup_listeners storm ({storm_events} events over {storm_elapsed:.2f}s, {debouncer.total_runs} reloads)", sum(reload_times) * 1000, None))
+    results.append((f"setup_listeners max reload (avg {debouncer.total_calls / max(debouncer.total_runs, 1):.1f} events coalesced)", max(reload_times, default=0) * 1000, None))
+
+    for config_entry in config_entries:
+        ma_registry.remove_registry(config_entry)
+
+    return results
+
+
+#-----------------------------------------------------------#
+#       Main
+#-----------------------------------------------------------#
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmarks the MA_Registry hot path against a stand-in HomeAssistant.")
+    parser.add_argument("scenarios", nargs="*", metavar="scenario", help=f"one of {', '.join(SCENARIOS.keys())} (default: all)")
+    parser.add_argument("--registries", type=int, default=40)
+    parser.add_argument("--areas-per-registry", type=int, default=3)
+    parser.add_argument("--storm-events", type=int, default=200)
+    args = parser.parse_args()
+
+    for scenario in args.scenarios:
+        if scenario not in SCENARIOS:
+            parser.error(f"unknown scenario {scenario}")
+
+    with patch_registries():
+        for scenario in args.scenarios or SCENARIOS.keys():
+            entity_count, area_count = SCENARIOS[scenario]
+            results = asyncio.run(async_run_scenario(entity_count, area_count, args.registries, args.areas_per_registry, args.storm_events))
+
+            print(f"\n{scenario}: {entity_count} entities, {area_count} areas, {args.registries} registries")
+            print(f"{'operation':<75} {'time (ms)':>12} {'peak (KiB)':>12}")
+
+            for name, elapsed, peak in results:
+                print(f"{name:<75} {elapsed:>12.3f} {'-' if peak is None else f'{peak:.1f}':>12}")
+
+
+if __name__ == "__main__":
+    main()
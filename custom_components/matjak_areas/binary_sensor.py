@@ -27,7 +27,7 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, asyn
     registry = get_registry(config_entry)
 
     if registry.config.binary_sensor_aggregation.enable:
-        entities = [AggregationSensor(registry, device_class) for device_class in registry.config.binary_sensor_aggregation.device_classes]
+        entities = [AggregationSensor(registry, registry.config.binary_sensor_aggregation, device_class) for device_class in registry.config.binary_sensor_aggregation.device_classes]
         async_add_entities(entities)
 
     if registry.config.presence.enable:
@@ -71,7 +71,7 @@ class Matjak_OptionsFlow(OptionsFlow):
     def __init__(self, config_entry: ConfigEntry):
         self._data = { **config_entry.options }
         self._flow_builder = OptionsFlowBuilder(self, config_entry, self._parse_configuration)
-        self._flow_builder.add_step("areas", "Areas", AreaConfig, self._data.get("areas", {}))
+        self._flow_builder.add_step("areas", "Areas", AreaConfig, self._data.get("areas", []), self._data.get("children", []))
         self._flow_builder.add_step("entities", "Entities", EntitiesConfig, **self._data.get("entities", {}))
         self._flow_builder.add_step("presence", "Presence Detection", PresenceConfig, **self._data.get("presence", {}))
         self._flow_builder.add_step("sensor_aggregation", "Sensor Aggregation", SensorAggregationConfig, **self._data.get("sensor_aggregation", {}))
@@ -13,3 +13,30 @@ from homeassistant.components.switch import DOMAIN as SWITCH_DOMAIN
 
 DOMAIN = "matjak_areas"
 PLATFORMS = [BINARY_SENSOR_DOMAIN, SENSOR_DOMAIN]
+
+
+#-----------------------------------------------------------#
+#       Attributes
+#-----------------------------------------------------------#
+
+ATTR_ACTIVE_COUNT = "active_count"
+ATTR_ACTIVE_ENTITIES = "active_entities"
+ATTR_AVAILABLE_COUNT = "available_count"
+ATTR_LAST_TRIGGERED = "last_triggered"
+ATTR_UNAVAILABLE_COUNT = "unavailable_count"
+
+ATTRIBUTE_MODE_COMPACT = "compact"
+ATTRIBUTE_MODE_FULL = "full"
+ATTRIBUTE_MODE_UNRECORDED = "unrecorded"
+ATTRIBUTE_MODES = [ATTRIBUTE_MODE_FULL, ATTRIBUTE_MODE_UNRECORDED, ATTRIBUTE_MODE_COMPACT]
+
+
+#-----------------------------------------------------------#
+#       Aggregation Modes
+#-----------------------------------------------------------#
+
+AGGREGATION_MODE_MAX = "max"
+AGGREGATION_MODE_MEDIAN = "median"
+AGGREGATION_MODE_MIN = "min"
+AGGREGATION_MODE_PERCENTILE = "percentile"
+AGGREGATION_MODES = [AGGREGATION_MODE_MIN, AGGREGATION_MODE_MAX, AGGREGATION_MODE_MEDIAN, AGGREGATION_MODE_PERCENTILE]
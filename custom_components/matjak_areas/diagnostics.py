@@ -0,0 +1,48 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from .const import DOMAIN
+from .platforms.binary_sensor.presence import CLEAR_TIMER_NAMESPACE
+from .utils.entity import MA_SensorEntity
+from .utils.registry import get_registry, get_registry_debouncer, get_registry_slicer
+from .utils.timers import get_timers
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import async_get_platforms
+from typing import Any
+
+
+#-----------------------------------------------------------#
+#       Diagnostics
+#-----------------------------------------------------------#
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, config_entry: ConfigEntry) -> dict[str, Any]:
+    """ Gets the diagnostics of a config entry. """
+    debouncer = get_registry_debouncer()
+    registry = get_registry(config_entry)
+    slicer = get_registry_slicer()
+    timers = get_timers(hass)
+    entities = [entity for platform in async_get_platforms(hass, DOMAIN) if platform.config_entry is config_entry for entity in platform.entities.values()]
+
+    return {
+        "registry": {
+            "id": registry.id,
+            "name": registry.name,
+            "entity_count": len(registry.entities),
+            "state_hub_listeners": registry.state_hub.listener_count,
+            "state_hub_trackers": registry.state_hub.tracker_count
+        },
+        "registry_reloads": {
+            "last_coalesced": debouncer.last_coalesced,
+            "total_calls": debouncer.total_calls,
+            "total_runs": debouncer.total_runs,
+            "last_slice_count": len(slicer.slice_times),
+            "last_max_slice_time": slicer.max_slice_time
+        },
+        "timers": {
+            "pending": timers.pending_count,
+            "pending_presence_clears": timers.get_pending_count(CLEAR_TIMER_NAMESPACE)
+        },
+        "suppressed_writes": { entity.entity_id: entity.suppressed_writes for entity in entities if isinstance(entity, MA_SensorEntity) }
+    }
@@ -3,12 +3,12 @@
 #-----------------------------------------------------------#
 
 from __future__ import annotations
+from ...utils.availability import MA_Availability
+from ...utils.config import BinarySensorAggregationConfig
 from ...utils.entity import MA_BinarySensorEntity
 from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
-from homeassistant.const import CONF_ENTITY_ID, STATE_ON
-from homeassistant.helpers.event import async_track_state_change
 from logging import getLogger, Logger
-from typing import Any, Callable
+from typing import Any, Callable, Iterable, Union
 
 
 #-----------------------------------------------------------#
@@ -27,10 +27,16 @@ class AggregationSensor(MA_BinarySensorEntity):
     #       Constructor
     #--------------------------------------------#
 
-    def __post_init__(self, device_class: str):
+    def __post_init__(self, config: BinarySensorAggregationConfig, device_class: str):
+        self._attribute_interval = config.attribute_interval
+        self._attribute_mode = config.attribute_mode
+        self._availability = MA_Availability(config.unavailable_threshold)
+        self._child_count: int = 0
+        self._child_listener: Callable = None
+        self._count_key: str = f"{BINARY_SENSOR_DOMAIN}.{device_class}"
         self._device_class: str = device_class
-        self._entities: list[str] = []
-        self._entities_on: list[str] = []
+        self._entities: set[str] = set()
+        self._entities_on: set[str] = set()
         self._state_listener: Callable = None
 
 
@@ -43,11 +49,6 @@ class AggregationSensor(MA_BinarySensorEntity):
         """ Gets the device class. """
         return self._device_class
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """ Gets the attributes. """
-        return { CONF_ENTITY_ID: self._entities_on }
-
     @property
     def name(self) -> str:
         """ Gets the name. """
@@ -59,30 +60,17 @@ class AggregationSensor(MA_BinarySensorEntity):
     #--------------------------------------------#
 
     async def async_clean_up(self) -> None:
+        if self._child_listener:
+            self._child_listener()
+
         if self._state_listener:
             self._state_listener()
 
     async def async_setup(self, *args: Any) -> None:
         await self.async_clean_up()
         self._entities = self._get_entities()
-        self._state_listener = async_track_state_change(self.hass, self._entities, self.async_on_state_change)
-        await self.async_update_state()
-
-    async def async_update_state(self) -> None:
-        self._entities_on = self._get_entities_on()
-        self.state = len(self._entities_on) > 0
-
-
-    #--------------------------------------------#
-    #       Event handlers
-    #--------------------------------------------#
-
-    async def async_on_registry_updated(self) -> None:
-        """ Triggered when the MA_Registry is updated. """
-        await self.async_setup()
-
-    async def async_on_state_change(self, *args) -> None:
-        """ Triggered when the tracked entities changes state. """
+        self._child_listener = self.registry.add_child_count_listener(self.async_on_child_count_changed)
+        self._state_listener = self.registry.state_hub.add_listener(self.async_on_state_change, { BINARY_SENSOR_DOMAIN: [self._device_class] })
         await self.async_update_state()
 
 
@@ -90,21 +78,15 @@ class AggregationSensor(MA_BinarySensorEntity):
     #       Private Methods
     #--------------------------------------------#
 
-    def _get_entities(self) -> list[str]:
-        """ Gets a list of entities to track. """
-        return self.registry.get_entities(domains=[BINARY_SENSOR_DOMAIN], device_classes=[self._device_class])
-
-    def _get_entities_on(self) -> list[str]:
-        """ Gets the entities that are on. """
-        result = []
-
-        for entity_id in self._entities:
-            state = self.hass.states.get(entity_id)
-
-            if state is None:
-                continue
+    def _get_entities(self, entity_ids: Union[Iterable[str], None] = None) -> set[str]:
+        """ Gets the entities to track, optionally only among the provided entities. """
+        if entity_ids is None:
+            return set(self.registry.get_entities(domains=[BINARY_SENSOR_DOMAIN], device_classes=[self._device_class]))
 
-            if state.state == STATE_ON:
-                result.append(entity_id)
+        return set(self.registry.filter_entities(entity_ids, domains=[BINARY_SENSOR_DOMAIN], device_classes=[self._device_class]))
 
-        return result
+    def _update_state(self) -> None:
+        """ Updates the state from the entities that are on and the child registries, publishing the count to the parent registries. """
+        count = len(self._entities_on) + self._child_count
+        self.registry.publish_count(self._count_key, count)
+        self.state = count > 0
@@ -3,18 +3,25 @@
 #-----------------------------------------------------------#
 
 from __future__ import annotations
+from ...utils.availability import MA_Availability
 from ...utils.config import PresenceConfig
 from ...utils.entity import MA_BinarySensorEntity
-from homeassistant.const import CONF_ENTITY_ID
-from homeassistant.helpers.event import async_call_later, async_track_state_change
+from ...utils.predicate import MA_StatePredicate
+from ...utils.timers import get_key, get_timers
+from homeassistant.const import STATE_ON
+from homeassistant.core import State
+from homeassistant.util import dt as dt_util
 from logging import getLogger, Logger
-from typing import Any, Callable
+from typing import Any, Callable, Iterable, Union
 
 
 #-----------------------------------------------------------#
 #       Constants
 #-----------------------------------------------------------#
 
+CLEAR_TIMER_NAMESPACE = "presence_clear"
+COUNT_KEY = "presence"
+WORKING_STATE_CLEAR_AT = "clear_at"
 LOGGER: Logger = getLogger(__name__)
 
 
@@ -28,16 +35,22 @@ class PresenceSensor(MA_BinarySensorEntity):
     #--------------------------------------------#
 
     def __post_init__(self, config: PresenceConfig):
+        self._attribute_interval = config.attribute_interval
+        self._attribute_mode = config.attribute_mode
+        self._availability = MA_Availability(config.unavailable_threshold)
+        self._child_count: int = 0
+        self._child_listener: Callable = None
         self._clear_timeout: int = config.clear_timeout
-        self._clear_listener: Callable = None
+        self._count_key: str = COUNT_KEY
         self._config: PresenceConfig = config
         self._device_class: str = config.device_class
         self._device_classes: dict[str, list[str]] = config.device_classes
         self._domains: list[str] = config.domains
-        self._entities: list[str] = []
-        self._entities_on: list[str] = []
-        self._states_on: list[str] = config.states_on
+        self._entities: set[str] = set()
+        self._entities_on: set[str] = set()
+        self._predicate: MA_StatePredicate = MA_StatePredicate(config.states_on)
         self._state_listener: Callable = None
+        self._timer_key: str = get_key(CLEAR_TIMER_NAMESPACE, self.registry.id)
 
 
     #--------------------------------------------#
@@ -49,11 +62,6 @@ class PresenceSensor(MA_BinarySensorEntity):
         """ Gets the device class. """
         return self._device_class
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """ Gets the attributes. """
-        return { CONF_ENTITY_ID: self._entities_on }
-
     @property
     def name(self) -> str:
         """ Gets the name. """
@@ -65,8 +73,10 @@ class PresenceSensor(MA_BinarySensorEntity):
     #--------------------------------------------#
 
     async def async_clean_up(self) -> None:
-        if self._clear_listener:
-            self._clear_listener()
+        get_timers(self.hass).cancel(self._timer_key)
+
+        if self._child_listener:
+            self._child_listener()
 
         if self._state_listener:
             self._state_listener()
@@ -74,66 +84,66 @@ class PresenceSensor(MA_BinarySensorEntity):
     async def async_setup(self, *args: Any) -> None:
         self._entities = self._get_entities()
 
+        if self._child_listener:
+            self._child_listener()
+
         if self._state_listener:
             self._state_listener()
 
-        self._state_listener = async_track_state_change(self.hass, self._entities, self.async_on_state_change)
+        self._child_listener = self.registry.add_child_count_listener(self.async_on_child_count_changed)
+        self._state_listener = self.registry.state_hub.add_listener(self.async_on_state_change, { domain: self._device_classes.get(domain, []) for domain in self._domains })
         await self.async_update_state()
 
-    async def async_update_state(self) -> None:
-        def async_clear(*args: Any) -> None:
-            self.state = False
-
-        self._entities_on = self._get_entities_on()
-
-        if len(self._entities_on) == 0:
-            if self._clear_listener is None:
-                self._clear_listener = async_call_later(self.hass, self._clear_timeout, async_clear)
-        else:
-            if self._clear_listener:
-                self._clear_listener()
-                self._clear_listener = None
-
-            self.state = True
-            self.async_schedule_update_ha_state()
-
+    def get_working_state(self) -> dict[str, Any]:
+        remaining = get_timers(self.hass).get_remaining(self._timer_key)
+        return { **super().get_working_state(), WORKING_STATE_CLEAR_AT: None if remaining is None else dt_util.utcnow().timestamp() + remaining }
 
-    #--------------------------------------------#
-    #       Event handlers
-    #--------------------------------------------#
+    def restore_working_state(self, working_state: dict[str, Any]) -> None:
+        """ Restores the entities that were on and the pending clear deadline, which is kept when the setup finds no entities on. """
+        super().restore_working_state(working_state)
+        clear_at = working_state.get(WORKING_STATE_CLEAR_AT, None)
 
-    async def async_on_registry_updated(self) -> None:
-        await self.async_setup()
-
-    async def async_on_state_change(self, *args) -> None:
-        """ Triggered when the tracked entities changes state. """
-        await self.async_update_state()
+        if clear_at is not None:
+            get_timers(self.hass).schedule(self._timer_key, max(clear_at - dt_util.utcnow().timestamp(), 0), self._clear)
 
 
     #--------------------------------------------#
     #       Private Methods
     #--------------------------------------------#
 
-    def _get_entities(self) -> list[str]:
-        """ Gets a list of entities to track. """
-        result = []
+    def _clear(self) -> None:
+        """ Clears the state when the clear timeout has passed, publishing the cleared presence to the parent registries. """
+        self.state = False
+        self.registry.publish_count(self._count_key, 0)
+
+    def _get_entities(self, entity_ids: Union[Iterable[str], None] = None) -> set[str]:
+        """ Gets the entities to track, optionally only among the provided entities. """
+        result = set()
 
         for domain in self._domains:
-            result = result + self.registry.get_entities(domains=[domain], device_classes=self._device_classes.get(domain, []))
+            if entity_ids is None:
+                result.update(self.registry.get_entities(domains=[domain], device_classes=self._device_classes.get(domain, [])))
+            else:
+                result.update(self.registry.filter_entities(entity_ids, domains=[domain], device_classes=self._device_classes.get(domain, [])))
 
         return result
 
-    def _get_entities_on(self) -> list[str]:
-        """ Gets the entities that are on. """
-        result = []
+    def _is_on(self, entity_id: str, state: Union[State, None]) -> bool:
+        """ Determines whether the state of the entity matches the presence rules. """
+        return self._predicate.matches(entity_id, state)
 
-        for entity_id in self._entities:
-            state = self.hass.states.get(entity_id)
+    def _update_state(self) -> None:
+        """ Updates the state from the entities that are on and the child registries, delaying clearing by the clear timeout using the shared timers. The presence (1 while on, including the clear timeout, otherwise 0) is published to the parent registries, so a parent stays on as long as any child presence sensor is on. """
+        count = len(self._entities_on) + self._child_count
+        timers = get_timers(self.hass)
 
-            if state is None:
-                continue
+        if count == 0:
+            if self.state == STATE_ON and not timers.is_scheduled(self._timer_key):
+                timers.schedule(self._timer_key, self._clear_timeout, self._clear)
 
-            if state.state in self._states_on:
-                result.append(entity_id)
+            self.schedule_state_write()
+        else:
+            timers.cancel(self._timer_key)
+            self.state = True
 
-        return result
+        self.registry.publish_count(self._count_key, 1 if self.state == STATE_ON else 0)
@@ -3,13 +3,20 @@
 #-----------------------------------------------------------#
 
 from __future__ import annotations
+from ...const import AGGREGATION_MODE_MAX, AGGREGATION_MODE_MEDIAN, AGGREGATION_MODE_MIN, AGGREGATION_MODE_PERCENTILE
+from ...utils.accumulator import MA_Accumulator
+from ...utils.availability import MA_Availability
+from ...utils.config import SensorAggregationConfig
 from ...utils.entity import MA_SensorEntity
+from ...utils.throttle import MA_Throttle
+from ...utils.timers import get_timers
+from ...utils.window import MA_TimeWindow
 from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN, SensorDeviceClass
-from homeassistant.const import CONF_UNIT_OF_MEASUREMENT, STATE_UNAVAILABLE, STATE_UNKNOWN
-from homeassistant.helpers.event import async_track_state_change
+from homeassistant.const import CONF_UNIT_OF_MEASUREMENT, STATE_UNKNOWN
+from homeassistant.core import State
+from homeassistant.util.unit_conversion import BaseUnitConverter, ElectricCurrentConverter, EnergyConverter, PowerConverter, TemperatureConverter
 from logging import getLogger, Logger
-from statistics import mean
-from typing import Any, Callable
+from typing import Any, Callable, Union
 
 
 #-----------------------------------------------------------#
@@ -22,6 +29,14 @@ AGGREGATE_MODE_SUM: list[str] = [
     SensorDeviceClass.POWER
 ]
 LOGGER: Logger = getLogger(__name__)
+UNIT_CONVERTERS: dict[str, type[BaseUnitConverter]] = {
+    SensorDeviceClass.CURRENT: ElectricCurrentConverter,
+    SensorDeviceClass.ENERGY: EnergyConverter,
+    SensorDeviceClass.POWER: PowerConverter,
+    SensorDeviceClass.TEMPERATURE: TemperatureConverter
+}
+WORKING_STATE_UNIT = "unit"
+WORKING_STATE_VALUES = "values"
 
 
 #-----------------------------------------------------------#
@@ -33,10 +48,19 @@ class AggregationSensor(MA_SensorEntity):
     #       Constructor
     #--------------------------------------------#
 
-    def __post_init__(self, device_class: str):
+    def __post_init__(self, config: SensorAggregationConfig, device_class: str, mode: Union[str, None] = None):
+        self._converter: Union[type[BaseUnitConverter], None] = UNIT_CONVERTERS.get(device_class, None)
+        self._accumulator = MA_Accumulator(converter=self._converter, ordered=mode is not None)
+        self._availability = MA_Availability(config.unavailable_threshold)
         self._device_class: str = device_class
-        self._entities: list[str] = []
+        self._entities: set[str] = set()
+        self._is_restored: bool = False
+        self._mode: Union[str, None] = mode
+        self._percentile: int = config.percentile
         self._state_listener: Callable  = None
+        self._throttle = MA_Throttle(config.min_interval, config.absolute_threshold, config.relative_threshold, config.max_staleness)
+        self._unit: Union[str, None] = None
+        self._window: Union[MA_TimeWindow, None] = MA_TimeWindow(config.window) if config.window > 0 else None
 
 
     #--------------------------------------------#
@@ -51,25 +75,23 @@ class AggregationSensor(MA_SensorEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """ Gets the attributes. """
-        return {}
+        return self._availability.attributes
 
     @property
     def name(self) -> str:
         """ Gets the name. """
-        return f"{self.registry.name} {self._device_class.capitalize()}"
+        if self._mode is None:
+            return f"{self.registry.name} {self._device_class.capitalize()}"
 
-    @property
-    def unit_of_measurement(self) -> str:
-        """ Gets the unit of measurement. """
-        for entity_id in self._entities:
-            state = self.hass.states.get(entity_id)
-
-            if state is None:
-                continue
+        if self._mode == AGGREGATION_MODE_PERCENTILE:
+            return f"{self.registry.name} {self._device_class.capitalize()} P{self._percentile}"
 
-            return state.attributes.get(CONF_UNIT_OF_MEASUREMENT)
+        return f"{self.registry.name} {self._device_class.capitalize()} {self._mode.capitalize()}"
 
-        return ""
+    @property
+    def unit_of_measurement(self) -> str:
+        """ Gets the cached unit of measurement. """
+        return self._unit or ""
 
 
     #--------------------------------------------#
@@ -77,54 +99,185 @@ class AggregationSensor(MA_SensorEntity):
     #--------------------------------------------#
 
     async def async_clean_up(self) -> None:
+        get_timers(self.hass).cancel(self._get_publish_key())
+        get_timers(self.hass).cancel(self._get_window_key())
+
         if self._state_listener:
             self._state_listener()
 
     async def async_setup(self, *args: Any) -> None:
         await self.async_clean_up()
-        self._entities = self.registry.get_entities(domains=[SENSOR_DOMAIN], device_classes=[self._device_class])
-        self._state_listener = async_track_state_change(self.hass, self._entities, self.async_on_state_change)
+        self._entities = set(self.registry.get_entities(domains=[SENSOR_DOMAIN], device_classes=[self._device_class]))
+        self._state_listener = self.registry.state_hub.add_listener(self.async_on_state_change, { SENSOR_DOMAIN: [self._device_class] })
         await self.async_update_state()
 
     async def async_update_state(self) -> None:
-        self.state = self._get_state()
+        self._update_unit()
+
+        if self._is_restored:
+            self._is_restored = False
+            changes = self._accumulator.reconcile(self._entities, self.hass.states.get)
+            LOGGER.debug(f"Reconciled {self.entity_id} with {changes} values changed since the last stop.")
+        else:
+            self._accumulator.reset(self._entities, self.hass.states.get)
+
+        self._availability.reset(self._entities, self.hass.states.get)
+        self._publish()
+
+    def get_working_state(self) -> dict[str, Any]:
+        return { WORKING_STATE_UNIT: self._unit, WORKING_STATE_VALUES: dict(self._accumulator.values) }
+
+    def restore_working_state(self, working_state: dict[str, Any]) -> None:
+        """ Restores the values of the sources as the baseline the first update reconciles against, unless they were normalized into another unit. Without a converter the values are not normalized, so only the cached unit is restored. """
+        unit = working_state.get(WORKING_STATE_UNIT, None)
+
+        if self._converter is None:
+            self._unit = unit
+        else:
+            self._update_unit()
+
+            if unit != self._unit:
+                return
+
+        self._accumulator.restore(working_state.get(WORKING_STATE_VALUES, {}))
+        self._is_restored = True
 
 
     #--------------------------------------------#
     #       Event handlers
     #--------------------------------------------#
 
-    async def async_on_registry_updated(self) -> None:
-        await self.async_setup()
+    async def async_on_registry_updated(self, added: set[str], removed: set[str]) -> None:
+        added_entities = self.registry.filter_entities(added, domains=[SENSOR_DOMAIN], device_classes=[self._device_class])
 
-    async def async_on_state_change(self, *args) -> None:
-        """ Triggered when the tracked entities changes state. """
-        await self.async_update_state()
+        if len(added_entities) == 0 and removed.isdisjoint(self._entities):
+            return
+
+        self._accumulator.remove(removed)
+        self._availability.remove(removed)
+        self._entities = (self._entities - removed) | set(added_entities)
+
+        for entity_id in added_entities:
+            state = self.hass.states.get(entity_id)
+            self._accumulator.update(entity_id, state)
+            self._availability.update(entity_id, state)
+
+        if self._converter is None:
+            self._update_unit()
+
+        self._publish()
+
+    async def async_on_state_change(self, entity_id: str, old_state: Union[State, None], new_state: Union[State, None]) -> None:
+        """ Triggered when the tracked entities changes state. Only the value and availability of the changed entity are updated. """
+        if entity_id not in self._entities:
+            return
+
+        if self._converter is None and self._get_state_unit(old_state) != self._get_state_unit(new_state):
+            self._update_unit()
+
+        self._accumulator.update(entity_id, new_state)
+        self._availability.update(entity_id, new_state)
+        self._publish()
 
 
     #--------------------------------------------#
     #       Private Methods
     #--------------------------------------------#
 
+    def _get_publish_key(self) -> str:
+        """ Gets the key of the throttled publish timer. """
+        return f"{self.entity_id}_publish"
+
     def _get_state(self) -> float:
-        """ Reevalutes the state of the entity. """
-        states = []
+        """ Gets the state from the running sum and count, or the order statistic of the mode, of the accumulator. """
+        if self._accumulator.count == 0:
+            return STATE_UNKNOWN
+
+        if self._mode == AGGREGATION_MODE_MAX:
+            return round(self._accumulator.max, 2)
+
+        if self._mode == AGGREGATION_MODE_MEDIAN:
+            return round(self._accumulator.get_percentile(50), 2)
+
+        if self._mode == AGGREGATION_MODE_MIN:
+            return round(self._accumulator.min, 2)
+
+        if self._mode == AGGREGATION_MODE_PERCENTILE:
+            return round(self._accumulator.get_percentile(self._percentile), 2)
+
+        if self._device_class in AGGREGATE_MODE_SUM:
+            return round(self._accumulator.sum, 2)
+
+        return round(self._accumulator.mean, 2)
+
+    def _get_state_unit(self, state: Union[State, None]) -> Union[str, None]:
+        """ Gets the unit of measurement of a state. """
+        return None if state is None else state.attributes.get(CONF_UNIT_OF_MEASUREMENT, None)
+
+    def _get_unit(self) -> Union[str, None]:
+        """ Gets the unit of measurement. Units that can be converted are normalized into a canonical unit, otherwise the unit of the first source is used. """
+        if self._converter is TemperatureConverter:
+            return self.hass.config.units.temperature_unit
+
+        if self._converter is not None:
+            return self._converter.NORMALIZED_UNIT
 
         for entity_id in self._entities:
             state = self.hass.states.get(entity_id)
 
-            if state is None:
-                continue
+            if state is not None:
+                return self._get_state_unit(state)
+
+        return None
+
+    def _get_window_key(self) -> str:
+        """ Gets the key of the window refresh timer. """
+        return f"{self.entity_id}_window"
+
+    def _get_windowed_state(self, now: float) -> float:
+        """ Gets the time-weighted average of the state over the window, if set. While the average differs from the state, a refresh is scheduled after each bucket so it keeps converging without new samples. """
+        state = self._get_state()
+
+        if self._window is None:
+            return state
+
+        self._window.add(state if state != STATE_UNKNOWN else None, now)
+        average = self._window.get_average(now)
+
+        if average is None:
+            return STATE_UNKNOWN
+
+        if round(average, 2) != state and not get_timers(self.hass).is_scheduled(self._get_window_key()):
+            get_timers(self.hass).schedule(self._get_window_key(), self._window.bucket_width, self._publish)
+
+        return round(average, 2)
+
+    def _publish(self) -> None:
+        """ Publishes the state if the throttle allows it, otherwise schedules a retry when the value becomes due. Attributes are written either way. """
+        now = self.hass.loop.time()
+        value = self._get_windowed_state(now)
+        delay = self._throttle.get_delay(value, now)
+        timers = get_timers(self.hass)
+
+        if delay == 0:
+            timers.cancel(self._get_publish_key())
+            self._throttle.mark_published(value, now)
+            self.state = value
+            return
 
-            if state.state in [STATE_UNAVAILABLE, STATE_UNKNOWN]:
-                continue
+        if delay is None:
+            timers.cancel(self._get_publish_key())
+        else:
+            remaining = timers.get_remaining(self._get_publish_key())
 
-            states.append(float(state.state))
+            if remaining is None or delay < remaining:
+                timers.schedule(self._get_publish_key(), delay, self._publish)
 
-        if len(states) > 0:
-            if self._device_class in AGGREGATE_MODE_SUM:
-                return round(sum(states), 2)
+        self.schedule_state_write()
 
-            return round(mean(states), 2)
+    def _update_unit(self) -> None:
+        """ Updates the cached unit of measurement and the unit the accumulator normalizes into. """
+        self._unit = self._get_unit()
 
-        return STATE_UNKNOWN
\ No newline at end of file
+        if self._converter is not None:
+            self._accumulator.unit = self._unit
@@ -0,0 +1,16 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from .const import ATTR_ACTIVE_ENTITIES
+from homeassistant.core import HomeAssistant, callback
+
+
+#-----------------------------------------------------------#
+#       Recorder
+#-----------------------------------------------------------#
+
+@callback
+def exclude_attributes(hass: HomeAssistant) -> set[str]:
+    """ Gets the attributes that are not recorded. """
+    return {ATTR_ACTIVE_ENTITIES}
@@ -26,7 +26,8 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, asyn
     registry = get_registry(config_entry)
 
     if registry.config.sensor_aggregation.enable:
-        entities = [AggregationSensor(registry, device_class) for device_class in registry.config.sensor_aggregation.device_classes]
+        config = registry.config.sensor_aggregation
+        entities = [AggregationSensor(registry, config, device_class, mode) for device_class in config.device_classes for mode in [None] + config.modes]
         async_add_entities(entities)
 
     return True
@@ -0,0 +1,209 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from __future__ import annotations
+from homeassistant.const import CONF_UNIT_OF_MEASUREMENT
+from homeassistant.core import State
+from homeassistant.util.unit_conversion import BaseUnitConverter
+from bisect import bisect_left, insort
+from math import floor, fsum, isfinite
+from typing import Callable, Iterable, Union
+
+
+#-----------------------------------------------------------#
+#       Constants
+#-----------------------------------------------------------#
+
+RESYNC_INTERVAL = 1000
+
+
+#-----------------------------------------------------------#
+#       MA_Accumulator
+#-----------------------------------------------------------#
+
+class MA_Accumulator:
+    """ Keeps a running sum and count of the numeric states of the sources, so a change is applied by subtracting the old value and adding the new one. The sum is recomputed every resync interval updates to bound floating-point drift. If a converter is given, values are normalized into the unit when parsed. If ordered, the values are also kept in a sorted list for order statistics. """
+
+    #--------------------------------------------#
+    #       Constructor
+    #--------------------------------------------#
+
+    def __init__(self, resync_interval: int = RESYNC_INTERVAL, converter: Union[type[BaseUnitConverter], None] = None, ordered: bool = False):
+        self._converter: Union[type[BaseUnitConverter], None] = converter
+        self._ordered: bool = ordered
+        self._resync_interval: int = resync_interval
+        self._sorted: list[float] = []
+        self._sum: float = 0
+        self._unit: Union[str, None] = None if converter is None else converter.NORMALIZED_UNIT
+        self._updates: int = 0
+        self._values: dict[str, float] = {}
+
+
+    #--------------------------------------------#
+    #       Properties
+    #--------------------------------------------#
+
+    @property
+    def count(self) -> int:
+        """ Gets the number of sources with a numeric state. """
+        return len(self._values)
+
+    @property
+    def max(self) -> Union[float, None]:
+        """ Gets the largest value, or None if there are none. Requires the accumulator to be ordered. """
+        return self._sorted[-1] if len(self._sorted) > 0 else None
+
+    @property
+    def mean(self) -> Union[float, None]:
+        """ Gets the mean of the values, or None if there are none. """
+        return self._sum / len(self._values) if len(self._values) > 0 else None
+
+    @property
+    def min(self) -> Union[float, None]:
+        """ Gets the smallest value, or None if there are none. Requires the accumulator to be ordered. """
+        return self._sorted[0] if len(self._sorted) > 0 else None
+
+    @property
+    def sum(self) -> float:
+        """ Gets the sum of the values. """
+        return self._sum
+
+    @property
+    def unit(self) -> Union[str, None]:
+        """ Gets the unit the values are normalized into. """
+        return self._unit
+
+    @unit.setter
+    def unit(self, value: Union[str, None]) -> None:
+        """ Sets the unit the values are normalized into. The values have to be reset afterwards. """
+        self._unit = value
+
+    @property
+    def values(self) -> dict[str, float]:
+        """ Gets the last parsed value per source. """
+        return self._values
+
+
+    #--------------------------------------------#
+    #       Methods
+    #--------------------------------------------#
+
+    def get_percentile(self, percentile: float) -> Union[float, None]:
+        """ Gets the percentile (0 to 100) of the values, interpolating linearly between the closest ranks, or None if there are none. Requires the accumulator to be ordered. """
+        if len(self._sorted) == 0:
+            return None
+
+        rank = (len(self._sorted) - 1) * percentile / 100
+        lower = floor(rank)
+
+        if lower + 1 >= len(self._sorted):
+            return self._sorted[-1]
+
+        return self._sorted[lower] + (self._sorted[lower + 1] - self._sorted[lower]) * (rank - lower)
+
+    def reconcile(self, entity_ids: Iterable[str], get_state: Callable[[str], Union[State, None]]) -> int:
+        """ Rereads the values of the sources, applying only the ones that differ from the current values, e.g. after a restore. Returns the number of changed values. """
+        entity_ids = set(entity_ids)
+        changes = 0
+        self.remove([entity_id for entity_id in self._values if entity_id not in entity_ids])
+
+        for entity_id in entity_ids:
+            value = parse_value(get_state(entity_id), self._converter, self._unit)
+
+            if value != self._values.get(entity_id, None):
+                self._set(entity_id, value)
+                changes += 1
+
+        return changes
+
+    def remove(self, entity_ids: Iterable[str]) -> None:
+        """ Removes the values of the sources. """
+        for entity_id in entity_ids:
+            self._set(entity_id, None)
+
+    def reset(self, entity_ids: Iterable[str], get_state: Callable[[str], Union[State, None]]) -> None:
+        """ Rereads the values of all sources. """
+        self._values = {}
+
+        for entity_id in entity_ids:
+            value = parse_value(get_state(entity_id), self._converter, self._unit)
+
+            if value is not None:
+                self._values[entity_id] = value
+
+        self._resync()
+
+    def restore(self, values: dict[str, float]) -> None:
+        """ Restores the values of the sources. """
+        self._values = { entity_id: float(value) for entity_id, value in values.items() }
+        self._resync()
+
+    def update(self, entity_id: str, state: Union[State, None]) -> None:
+        """ Applies the new state of a source. """
+        self._set(entity_id, parse_value(state, self._converter, self._unit))
+
+
+    #--------------------------------------------#
+    #       Private Methods
+    #--------------------------------------------#
+
+    def _resync(self) -> None:
+        """ Recomputes the sum, and the sorted list if ordered, from the values. """
+        self._sorted = sorted(self._values.values()) if self._ordered else []
+        self._sum = fsum(self._values.values())
+        self._updates = 0
+
+    def _set(self, entity_id: str, value: Union[float, None]) -> None:
+        """ Replaces the value of a source, removing it if the value is None. """
+        old_value = self._values.pop(entity_id, None) if value is None else self._values.get(entity_id, None)
+
+        if old_value is None and value is None:
+            return
+
+        if value is not None:
+            self._values[entity_id] = value
+
+        if self._ordered:
+            if old_value is not None:
+                del self._sorted[bisect_left(self._sorted, old_value)]
+
+            if value is not None:
+                insort(self._sorted, value)
+
+        self._sum += (value or 0) - (old_value or 0)
+        self._updates += 1
+
+        if self._updates >= self._resync_interval or len(self._values) == 0:
+            self._resync()
+
+
+#-----------------------------------------------------------#
+#       Public Methods
+#-----------------------------------------------------------#
+
+def parse_value(state: Union[State, None], converter: Union[type[BaseUnitConverter], None] = None, unit: Union[str, None] = None) -> Union[float, None]:
+    """ Parses the numeric value of a state, converted into the unit if a converter is given. Returns None if the state has no numeric value or its unit cannot be converted. """
+    if state is None:
+        return None
+
+    try:
+        value = float(state.state)
+    except (TypeError, ValueError):
+        return None
+
+    if not isfinite(value):
+        return None
+
+    if converter is None:
+        return value
+
+    state_unit = state.attributes.get(CONF_UNIT_OF_MEASUREMENT, None)
+
+    if state_unit == unit:
+        return value
+
+    if state_unit not in converter.VALID_UNITS:
+        return None
+
+    return converter.convert(value, state_unit, unit)
@@ -0,0 +1,86 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from __future__ import annotations
+from ..const import ATTR_AVAILABLE_COUNT, ATTR_UNAVAILABLE_COUNT
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import State
+from typing import Any, Callable, Iterable, Union
+
+
+#-----------------------------------------------------------#
+#       Constants
+#-----------------------------------------------------------#
+
+UNAVAILABLE_STATES: frozenset[str] = frozenset([STATE_UNAVAILABLE, STATE_UNKNOWN])
+
+
+#-----------------------------------------------------------#
+#       MA_Availability
+#-----------------------------------------------------------#
+
+class MA_Availability:
+    """ Counts the available and unavailable sources of an aggregate. A source is unavailable if it has no state, or its state is unavailable or unknown. """
+
+    #--------------------------------------------#
+    #       Constructor
+    #--------------------------------------------#
+
+    def __init__(self, threshold: int = 100):
+        self._entities: set[str] = set()
+        self._threshold: int = threshold
+        self._unavailable: set[str] = set()
+
+
+    #--------------------------------------------#
+    #       Properties
+    #--------------------------------------------#
+
+    @property
+    def attributes(self) -> dict[str, Any]:
+        """ Gets the attributes exposing the counts. """
+        return { ATTR_AVAILABLE_COUNT: self.available_count, ATTR_UNAVAILABLE_COUNT: self.unavailable_count }
+
+    @property
+    def available_count(self) -> int:
+        """ Gets the number of available sources. """
+        return len(self._entities) - len(self._unavailable)
+
+    @property
+    def is_available(self) -> bool:
+        """ Gets a boolean indicating whether no more than the threshold (in percent) of the sources is unavailable. """
+        return len(self._unavailable) * 100 <= self._threshold * len(self._entities)
+
+    @property
+    def unavailable_count(self) -> int:
+        """ Gets the number of unavailable sources. """
+        return len(self._unavailable)
+
+
+    #--------------------------------------------#
+    #       Methods
+    #--------------------------------------------#
+
+    def remove(self, entity_ids: Iterable[str]) -> None:
+        """ Stops counting the sources. """
+        for entity_id in entity_ids:
+            self._entities.discard(entity_id)
+            self._unavailable.discard(entity_id)
+
+    def reset(self, entity_ids: Iterable[str], get_state: Callable[[str], Union[State, None]]) -> None:
+        """ Recounts all sources. """
+        self._entities.clear()
+        self._unavailable.clear()
+
+        for entity_id in entity_ids:
+            self.update(entity_id, get_state(entity_id))
+
+    def update(self, entity_id: str, state: Union[State, None]) -> None:
+        """ Counts a source with its new state. """
+        self._entities.add(entity_id)
+
+        if state is None or state.state in UNAVAILABLE_STATES:
+            self._unavailable.add(entity_id)
+        else:
+            self._unavailable.discard(entity_id)
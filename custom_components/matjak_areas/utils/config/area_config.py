@@ -2,8 +2,10 @@
 #       Imports
 #-----------------------------------------------------------#
 
+from ...const import DOMAIN
 from .base_config import BaseConfig
 from dataclasses import dataclass, field
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import area_registry, config_validation as cv
 from homeassistant.helpers.template import area_id, area_name
@@ -22,6 +24,7 @@ class AreaConfig(BaseConfig):
     #--------------------------------------------#
 
     areas: list[str] = field(default_factory=list)
+    children: list[str] = field(default_factory=list)
 
 
     #--------------------------------------------#
@@ -33,8 +36,12 @@ class AreaConfig(BaseConfig):
         selected_areas = [area_name(hass, area) for area in self.areas]
         areas = selected_areas + [area for area in all_areas if area not in selected_areas]
 
+        config_entry: ConfigEntry = kwargs.get("config_entry")
+        children = { entry.entry_id: entry.title for entry in hass.config_entries.async_entries(DOMAIN) if config_entry is None or entry.entry_id != config_entry.entry_id }
+
         return vol.Schema({
-            vol.Required("areas", default=selected_areas): cv.multi_select(areas)
+            vol.Required("areas", default=selected_areas): cv.multi_select(areas),
+            vol.Required("children", default=[child for child in self.children if child in children]): cv.multi_select(children)
         })
 
     def validate(self, hass: HomeAssistant) -> tuple[bool, dict[str, str]]:
@@ -2,6 +2,7 @@
 #       Imports
 #-----------------------------------------------------------#
 
+from ...const import ATTRIBUTE_MODE_FULL, ATTRIBUTE_MODES
 from .base_config import BaseConfig
 from dataclasses import dataclass, field
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
@@ -35,8 +36,11 @@ class BinarySensorAggregationConfig(BaseConfig):
     #       Fields
     #--------------------------------------------#
 
+    attribute_interval: int = 0
+    attribute_mode: str = ATTRIBUTE_MODE_FULL
     device_classes: list[str] = field(default_factory=list)
     enable: bool = False
+    unavailable_threshold: int = 100
 
 
     #--------------------------------------------#
@@ -57,6 +61,9 @@ class BinarySensorAggregationConfig(BaseConfig):
 
         return vol.Schema({
             vol.Required("enable", default=self.enable): bool,
-            vol.Required("device_classes", default=self.device_classes): cv.multi_select(device_classes)
+            vol.Required("device_classes", default=self.device_classes): cv.multi_select(device_classes),
+            vol.Required("attribute_mode", default=self.attribute_mode): vol.In(ATTRIBUTE_MODES),
+            vol.Required("attribute_interval", default=self.attribute_interval): vol.All(int, vol.Range(min=0)),
+            vol.Required("unavailable_threshold", default=self.unavailable_threshold): vol.All(int, vol.Range(min=0, max=100))
         })
 
@@ -2,6 +2,8 @@
 #       Imports
 #-----------------------------------------------------------#
 
+from ...const import ATTRIBUTE_MODE_FULL, ATTRIBUTE_MODES
+from ..predicate import parse_rule
 from .base_config import BaseConfig
 from dataclasses import dataclass, field
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
@@ -30,12 +32,15 @@ class PresenceConfig(BaseConfig):
     #       Fields
     #--------------------------------------------#
 
+    attribute_interval: int = 0
+    attribute_mode: str = ATTRIBUTE_MODE_FULL
     clear_timeout: int = 0
     enable: bool = False
     device_class: str = DEVICE_CLASSES[1]
     device_classes: dict[str, list[str]] = field(default_factory=lambda: {"binary_sensor": [BinarySensorDeviceClass.MOTION.value, BinarySensorDeviceClass.OCCUPANCY.value, BinarySensorDeviceClass.PRESENCE.value]})
     domains: list[str] = field(default_factory=lambda: [PresenceConfig.DOMAINS[0]])
     states_on: list[str] = field(default_factory=lambda: ["on", "playing", "home", "open"])
+    unavailable_threshold: int = 100
 
 
     #--------------------------------------------#
@@ -71,9 +76,24 @@ class PresenceConfig(BaseConfig):
             vol.Required("device_classes", default=selected_device_classes): cv.multi_select(device_classes),
             vol.Required("states_on", default=", ".join(self.states_on)): str,
             vol.Required("clear_timeout", default=self.clear_timeout): vol.All(int, vol.Range(min=0)),
-            vol.Required("device_class", default=self.device_class): vol.In(self.DEVICE_CLASSES)
+            vol.Required("device_class", default=self.device_class): vol.In(self.DEVICE_CLASSES),
+            vol.Required("attribute_mode", default=self.attribute_mode): vol.In(ATTRIBUTE_MODES),
+            vol.Required("attribute_interval", default=self.attribute_interval): vol.All(int, vol.Range(min=0)),
+            vol.Required("unavailable_threshold", default=self.unavailable_threshold): vol.All(int, vol.Range(min=0, max=100))
         })
 
+    def validate(self, hass: HomeAssistant) -> tuple[bool, dict[str, str]]:
+        errors: dict[str, str] = {}
+
+        for rule in self.states_on:
+            try:
+                parse_rule(rule)
+            except ValueError:
+                errors["states_on"] = "states_on_invalid"
+                break
+
+        return len(errors) == 0, errors
+
 
     #--------------------------------------------#
     #       Private Methods
@@ -16,6 +16,7 @@ from typing import Any, TypedDict
 
 class ConfigEntryOptions(TypedDict):
     areas: list[str]
+    children: list[str]
     entities: dict[str, Any]
     presence: dict[str, Any]
     sensor_aggregation: dict[str, Any]
@@ -34,6 +35,7 @@ class RegistryConfig:
 
     areas: list[str]
     binary_sensor_aggregation: BinarySensorAggregationConfig
+    children: list[str]
     entities: EntitiesConfig
     presence: PresenceConfig
     sensor_aggregation: SensorAggregationConfig
@@ -47,6 +49,7 @@ class RegistryConfig:
     def __init__(self, config: ConfigEntryOptions) -> None:
         """ Triggered after the class has initially been initialized. """
         self.areas = config.get("areas", [])
+        self.children = config.get("children", [])
         self.entities = EntitiesConfig(**config.get("entities", {}))
         self.presence = PresenceConfig(**config.get("presence", {}))
         self.binary_sensor_aggregation = BinarySensorAggregationConfig(**config.get("binary_sensor_aggregation", {}))
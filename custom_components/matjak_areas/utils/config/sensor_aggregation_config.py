@@ -2,6 +2,7 @@
 #       Imports
 #-----------------------------------------------------------#
 
+from ...const import AGGREGATION_MODES
 from .base_config import BaseConfig
 from dataclasses import dataclass, field
 from homeassistant.components.sensor import SensorDeviceClass
@@ -41,8 +42,16 @@ class SensorAggregationConfig(BaseConfig):
     #       Fields
     #--------------------------------------------#
 
+    absolute_threshold: float = 0
     device_classes: list[str] = field(default_factory=list)
     enable: bool = False
+    max_staleness: int = 0
+    min_interval: int = 0
+    modes: list[str] = field(default_factory=list)
+    percentile: int = 90
+    relative_threshold: float = 0
+    unavailable_threshold: int = 100
+    window: int = 0
 
 
     #--------------------------------------------#
@@ -63,6 +72,14 @@ class SensorAggregationConfig(BaseConfig):
 
         return vol.Schema({
             vol.Required("enable", default=self.enable): bool,
-            vol.Required("device_classes", default=self.device_classes): cv.multi_select(device_classes)
+            vol.Required("device_classes", default=self.device_classes): cv.multi_select(device_classes),
+            vol.Required("modes", default=self.modes): cv.multi_select(AGGREGATION_MODES),
+            vol.Required("percentile", default=self.percentile): vol.All(int, vol.Range(min=0, max=100)),
+            vol.Required("unavailable_threshold", default=self.unavailable_threshold): vol.All(int, vol.Range(min=0, max=100)),
+            vol.Required("min_interval", default=self.min_interval): vol.All(int, vol.Range(min=0)),
+            vol.Required("absolute_threshold", default=self.absolute_threshold): vol.All(vol.Coerce(float), vol.Range(min=0)),
+            vol.Required("relative_threshold", default=self.relative_threshold): vol.All(vol.Coerce(float), vol.Range(min=0)),
+            vol.Required("max_staleness", default=self.max_staleness): vol.All(int, vol.Range(min=0)),
+            vol.Required("window", default=self.window): vol.All(int, vol.Range(min=0))
         })
 
@@ -0,0 +1,127 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from __future__ import annotations
+from .types import RemoveListener
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.event import async_call_later
+from logging import getLogger, Logger
+from typing import Any, Awaitable, Callable
+
+
+#-----------------------------------------------------------#
+#       Constants
+#-----------------------------------------------------------#
+
+LOGGER: Logger = getLogger(__name__)
+
+
+#-----------------------------------------------------------#
+#       MA_Debouncer
+#-----------------------------------------------------------#
+
+class MA_Debouncer:
+    #--------------------------------------------#
+    #       Constructor
+    #--------------------------------------------#
+
+    def __init__(self, hass: HomeAssistant, function: Callable[[], Awaitable[None]], quiet_period: float, max_wait: float):
+        self._calls: int = 0
+        self._first_call_time: float = None
+        self._function: Callable[[], Awaitable[None]] = function
+        self._hass: HomeAssistant = hass
+        self._is_running: bool = False
+        self._last_coalesced: int = 0
+        self._max_wait: float = max(max_wait, quiet_period)
+        self._quiet_period: float = quiet_period
+        self._run_again: bool = False
+        self._timer_listener: RemoveListener = None
+        self._total_calls: int = 0
+        self._total_runs: int = 0
+
+
+    #--------------------------------------------#
+    #       Properties
+    #--------------------------------------------#
+
+    @property
+    def last_coalesced(self) -> int:
+        """ Gets the number of calls coalesced into the last run. """
+        return self._last_coalesced
+
+    @property
+    def pending_calls(self) -> int:
+        """ Gets the number of calls waiting for the next run. """
+        return self._calls
+
+    @property
+    def total_calls(self) -> int:
+        """ Gets the total number of calls. """
+        return self._total_calls
+
+    @property
+    def total_runs(self) -> int:
+        """ Gets the total number of runs. """
+        return self._total_runs
+
+
+    #--------------------------------------------#
+    #       Methods
+    #--------------------------------------------#
+
+    def async_call(self) -> None:
+        """ Requests a run. The run happens once no calls have been made for the quiet period, but no later than the maximum wait after the first call. """
+        now = self._hass.loop.time()
+
+        if self._calls == 0:
+            self._first_call_time = now
+
+        self._calls += 1
+        self._total_calls += 1
+        self._cancel_timer()
+
+        delay = min(self._quiet_period, self._first_call_time + self._max_wait - now)
+        self._timer_listener = async_call_later(self._hass, max(delay, 0), self._async_run)
+
+    def async_cancel(self) -> None:
+        """ Cancels a pending run. """
+        self._cancel_timer()
+        self._calls = 0
+        self._run_again = False
+
+
+    #--------------------------------------------#
+    #       Private Methods
+    #--------------------------------------------#
+
+    def _cancel_timer(self) -> None:
+        """ Cancels the timer. """
+        if self._timer_listener:
+            self._timer_listener()
+            self._timer_listener = None
+
+    async def _async_run(self, *args: Any) -> None:
+        """ Runs the function, coalescing all pending calls. """
+        self._timer_listener = None
+
+        if self._is_running:
+            self._run_again = True
+            return
+
+        while True:
+            self._last_coalesced = self._calls
+            self._calls = 0
+            self._is_running = True
+            self._total_runs += 1
+
+            try:
+                await self._function()
+            finally:
+                self._is_running = False
+
+            if not self._run_again:
+                break
+
+            self._run_again = False
+            self._cancel_timer()
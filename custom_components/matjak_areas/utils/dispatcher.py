@@ -0,0 +1,94 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from __future__ import annotations
+from .types import RemoveListener
+from homeassistant.core import HomeAssistant
+from itertools import count
+from logging import getLogger, Logger
+from types import MethodType
+from typing import Any, Awaitable, Callable, cast, Union
+import weakref
+
+
+#-----------------------------------------------------------#
+#       Types
+#-----------------------------------------------------------#
+
+AsyncListener = Callable[..., Awaitable[None]]
+
+
+#-----------------------------------------------------------#
+#       Constants
+#-----------------------------------------------------------#
+
+LOGGER: Logger = getLogger(__name__)
+
+
+#-----------------------------------------------------------#
+#       MA_Dispatcher
+#-----------------------------------------------------------#
+
+class MA_Dispatcher:
+    #--------------------------------------------#
+    #       Constructor
+    #--------------------------------------------#
+
+    def __init__(self, hass: HomeAssistant):
+        self._hass: HomeAssistant = hass
+        self._keys = count()
+        self._listeners: dict[int, Union[weakref.WeakMethod[MethodType], weakref.ref]] = {}
+
+
+    #--------------------------------------------#
+    #       Properties
+    #--------------------------------------------#
+
+    @property
+    def listener_count(self) -> int:
+        """ Gets the number of listeners. """
+        return len(self._listeners)
+
+
+    #--------------------------------------------#
+    #       Methods
+    #--------------------------------------------#
+
+    def add_listener(self, listener: AsyncListener) -> RemoveListener:
+        """ Adds a weakly referenced listener. The listener is removed automatically when its owner is garbage collected. """
+        key = next(self._keys)
+        self._listeners[key] = self._create_weak_listener(listener, lambda *args: self._listeners.pop(key, None))
+        return lambda: self._listeners.pop(key, None)
+
+    def dispatch(self, *args: Any) -> None:
+        """ Calls all listeners with the arguments in a single task. """
+        listeners = []
+
+        for key, weak_listener in list(self._listeners.items()):
+            listener = weak_listener()
+
+            if listener is None:
+                self._listeners.pop(key, None)
+            else:
+                listeners.append(listener)
+
+        if len(listeners) > 0:
+            self._hass.async_create_task(self._async_call_listeners(listeners, args))
+
+
+    #--------------------------------------------#
+    #       Private Methods
+    #--------------------------------------------#
+
+    async def _async_call_listeners(self, listeners: list[AsyncListener], args: tuple) -> None:
+        """ Calls the listeners one after another, isolating failures. """
+        for listener in listeners:
+            try:
+                await listener(*args)
+            except Exception:
+                LOGGER.exception(f"Error calling listener {listener}.")
+
+    def _create_weak_listener(self, listener: Callable, on_collected: Callable) -> Union[weakref.WeakMethod[MethodType], weakref.ref]:
+        """ Creates a weak listener from a listener. """
+        return weakref.WeakMethod(cast(MethodType, listener), on_collected) if hasattr(listener, "__self__") else weakref.ref(listener, on_collected)
@@ -2,19 +2,22 @@
 #       Imports
 #-----------------------------------------------------------#
 
-from ..const import DOMAIN
+from ..const import ATTR_ACTIVE_COUNT, ATTR_ACTIVE_ENTITIES, ATTR_LAST_TRIGGERED, ATTRIBUTE_MODE_COMPACT, ATTRIBUTE_MODE_FULL, ATTRIBUTE_MODE_UNRECORDED, DOMAIN
+from .availability import MA_Availability
 from .registry import MA_Registry
+from .startup import get_startup_barrier
+from .timers import get_timers
 from homeassistant.components.switch import SwitchEntity
-from homeassistant.const import EVENT_HOMEASSISTANT_START, STATE_OFF, STATE_ON
+from homeassistant.const import CONF_ENTITY_ID, STATE_OFF, STATE_ON
 from homeassistant.core import Context, State
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.entity import Entity
-from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.restore_state import ExtraStoredData, RestoredExtraData, RestoreEntity
 from homeassistant.helpers.template import is_template_string, Template
 from homeassistant.helpers.typing import StateType
 from homeassistant.util import get_random_string
 from logging import getLogger
-from typing import Any, Callable, Union, final
+from typing import Any, Callable, Collection, Iterable, Union, final
 
 
 #-----------------------------------------------------------#
@@ -24,6 +27,8 @@ from typing import Any, Callable, Union, final
 CONTEXT_PREFIX_LENGTH = 6
 CONTEXT_MAX_LENGTH = 36
 LOGGER = getLogger(__name__)
+WORKING_STATE_ENTITIES_ON = "entities_on"
+WORKING_STATE_LAST_TRIGGERED = "last_triggered"
 
 
 #-----------------------------------------------------------#
@@ -69,13 +74,13 @@ class MA_Entity(RestoreEntity, Entity):
     #--------------------------------------------#
 
     async def async_added_to_hass(self) -> None:
-        """ Triggered when the entity has been added to HomeAssistant. """
+        """ Triggered when the entity has been added to HomeAssistant. The restored state is applied first, so the setup reconciles it with the current states. """
+        await self.async_initialize(await self.async_get_last_state())
+
         if self.hass.is_running:
             await self.async_setup()
         else:
-            self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_START, self.async_setup)
-
-        await self.async_initialize(await self.async_get_last_state())
+            self.async_on_remove(get_startup_barrier(self.hass).add_listener(self.async_setup))
 
     async def async_will_remove_from_hass(self) -> None:
         """ Triggered when the entity is about to be removed from HomeAssistant. """
@@ -103,8 +108,8 @@ class MA_Entity(RestoreEntity, Entity):
     #       Overridable Event Handlers
     #--------------------------------------------#
 
-    async def async_on_registry_updated(self) -> None:
-        """ Triggered when the MA registry is updated. """
+    async def async_on_registry_updated(self, added: set[str], removed: set[str]) -> None:
+        """ Triggered when the MA registry is updated. Entities that were reindexed are contained in both added and removed. """
         pass
 
 
@@ -165,13 +170,29 @@ class MA_SensorEntity(MA_Entity):
     #       Fields
     #--------------------------------------------#
 
+    _attribute_interval: float = 0
+    _availability: Union[MA_Availability, None] = None
     _state: StateType = None
+    _suppressed_writes: int = 0
+    _written_at: float = 0
+    _written_state: Union[tuple[StateType, dict[str, Any], Union[str, None], bool], None] = None
 
 
     #--------------------------------------------#
     #       Properties
     #--------------------------------------------#
 
+    @property
+    def available(self) -> bool:
+        """ Gets a boolean indicating whether enough sources are available. """
+        return self._availability is None or self._availability.is_available
+
+    @property
+    def extra_restore_state_data(self) -> Union[ExtraStoredData, None]:
+        """ Gets the working state to store for the next start. """
+        working_state = self.get_working_state()
+        return None if working_state is None else RestoredExtraData(working_state)
+
     @property
     def state(self) -> StateType:
         """ Gets the state. """
@@ -181,7 +202,12 @@ class MA_SensorEntity(MA_Entity):
     def state(self, value: StateType) -> None:
         """ Sets the state. """
         self._state = value
-        self.async_schedule_update_ha_state()
+        self.schedule_state_write()
+
+    @property
+    def suppressed_writes(self) -> int:
+        """ Gets the number of state writes that were skipped because nothing changed. """
+        return self._suppressed_writes
 
 
     #--------------------------------------------#
@@ -191,11 +217,42 @@ class MA_SensorEntity(MA_Entity):
     @final
     async def async_initialize(self, last_state: Union[State, None]) -> None:
         self.async_on_remove(self.registry.add_update_listener(self.async_on_registry_updated))
+        self.async_on_remove(lambda: get_timers(self.hass).cancel(self._get_write_key()))
 
-        if last_state:
-            self.state = last_state.state
-        else:
+        if last_state is None:
             await self.async_update_state()
+            return
+
+        last_extra_data = await self.async_get_last_extra_data()
+
+        if last_extra_data:
+            self.restore_working_state(last_extra_data.as_dict())
+
+        self.restore_state(last_state)
+
+    def schedule_state_write(self) -> None:
+        """ Schedules a state write if the state, the attributes, the unit of measurement or the availability changed since the last write. Writes that only change the attributes are deferred until the attribute interval has passed. """
+        written_state = (self.state, dict(self.extra_state_attributes or {}), self.unit_of_measurement, self.available)
+        timers = get_timers(self.hass)
+
+        if written_state == self._written_state:
+            self._suppressed_writes += 1
+            return
+
+        if self._attribute_interval > 0 and self._written_state is not None and written_state[0] == self._written_state[0] and written_state[2:] == self._written_state[2:]:
+            remaining = self._written_at + self._attribute_interval - self.hass.loop.time()
+
+            if remaining > 0:
+                if not timers.is_scheduled(self._get_write_key()):
+                    timers.schedule(self._get_write_key(), remaining, self.schedule_state_write)
+
+                self._suppressed_writes += 1
+                return
+
+        timers.cancel(self._get_write_key())
+        self._written_at = self.hass.loop.time()
+        self._written_state = written_state
+        self.async_schedule_update_ha_state()
 
 
     #--------------------------------------------#
@@ -206,21 +263,205 @@ class MA_SensorEntity(MA_Entity):
         """ Updates the entity state. """
         pass
 
+    def get_working_state(self) -> Union[dict[str, Any], None]:
+        """ Gets the JSON serializable working state that is restored on the next start, or None if there is none. """
+        return None
+
+    def restore_state(self, last_state: State) -> None:
+        """ Restores the state from the last state. """
+        self.state = last_state.state
+
+    def restore_working_state(self, working_state: dict[str, Any]) -> None:
+        """ Restores the working state stored on the last stop. Triggered before the state is restored. """
+        pass
+
+
+    #--------------------------------------------#
+    #       Private Methods
+    #--------------------------------------------#
+
+    def _get_write_key(self) -> str:
+        """ Gets the key of the deferred state write timer. """
+        return f"{self.entity_id}_write"
+
 
 #-----------------------------------------------------------#
 #       MA_BinarySensorEntity
 #-----------------------------------------------------------#
 
 class MA_BinarySensorEntity(MA_SensorEntity):
+    #--------------------------------------------#
+    #       Fields
+    #--------------------------------------------#
+
+    _attribute_mode: str = ATTRIBUTE_MODE_FULL
+    _child_count: int = 0
+    _count_key: str = ""
+    _entities: set[str] = frozenset()
+    _entities_on: set[str] = frozenset()
+    _last_triggered: Union[str, None] = None
+    _restored_entities_on: Union[set[str], None] = None
+    _unrecorded_attributes = frozenset({ATTR_ACTIVE_ENTITIES})
+
+
     #--------------------------------------------#
     #       Properties
     #--------------------------------------------#
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """ Gets the attributes. """
+        attributes = self.get_entities_on_attributes(self._entities_on, self._child_count)
+
+        if self._availability is not None:
+            attributes.update(self._availability.attributes)
+
+        return attributes
+
     @MA_SensorEntity.state.getter
     def state(self) -> StateType:
         return STATE_ON if super().state else STATE_OFF
 
 
+    #--------------------------------------------#
+    #       Methods
+    #--------------------------------------------#
+
+    def get_entities_on_attributes(self, entities_on: Collection[str], child_count: int = 0) -> dict[str, Any]:
+        """ Gets the attributes describing the entities that are on, according to the attribute mode. The count of the child registries is included in the compact count. """
+        if self._attribute_mode == ATTRIBUTE_MODE_COMPACT:
+            return { ATTR_ACTIVE_COUNT: len(entities_on) + child_count, ATTR_LAST_TRIGGERED: self._last_triggered }
+
+        if self._attribute_mode == ATTRIBUTE_MODE_UNRECORDED:
+            return { ATTR_ACTIVE_ENTITIES: list(entities_on) }
+
+        return { CONF_ENTITY_ID: list(entities_on) }
+
+
+    #--------------------------------------------#
+    #       Overridable Methods
+    #--------------------------------------------#
+
+    async def async_update_state(self) -> None:
+        self._child_count = self.registry.get_child_count(self._count_key)
+
+        if self._availability is not None:
+            self._availability.reset(self._entities, self.hass.states.get)
+
+        if self._restored_entities_on is None:
+            self._entities_on = self._get_entities_on()
+        else:
+            self._reconcile_entities_on()
+
+        self._update_state()
+
+    def get_working_state(self) -> dict[str, Any]:
+        return { WORKING_STATE_ENTITIES_ON: list(self._entities_on), WORKING_STATE_LAST_TRIGGERED: self._last_triggered }
+
+    def restore_state(self, last_state: State) -> None:
+        """ Restores the state from the last state. """
+        self.state = last_state.state == STATE_ON
+
+    def restore_working_state(self, working_state: dict[str, Any]) -> None:
+        """ Restores the entities that were on, which the first update uses as the baseline to reconcile against. """
+        self._entities_on = set(working_state.get(WORKING_STATE_ENTITIES_ON, []))
+        self._last_triggered = working_state.get(WORKING_STATE_LAST_TRIGGERED, None)
+        self._restored_entities_on = set(self._entities_on)
+
+
+    #--------------------------------------------#
+    #       Event Handlers
+    #--------------------------------------------#
+
+    async def async_on_child_count_changed(self, key: str) -> None:
+        """ Triggered when a count of a child registry changes. """
+        if key != self._count_key:
+            return
+
+        self._child_count = self.registry.get_child_count(key)
+        self._update_state()
+
+    async def async_on_registry_updated(self, added: set[str], removed: set[str]) -> None:
+        """ Triggered when the MA_Registry is updated. Only the added and removed entities are evaluated. """
+        added_entities = self._get_entities(added)
+
+        if len(added_entities) == 0 and removed.isdisjoint(self._entities):
+            return
+
+        self._entities = (self._entities - removed) | added_entities
+
+        if self._availability is not None:
+            self._availability.remove(removed)
+
+            for entity_id in added_entities:
+                self._availability.update(entity_id, self.hass.states.get(entity_id))
+
+        self._entities_on = (self._entities_on - removed) | self._get_entities_on(added_entities)
+        self._update_state()
+
+    async def async_on_state_change(self, entity_id: str, old_state: Union[State, None], new_state: Union[State, None]) -> None:
+        """ Triggered when a tracked entity changes state. Only the new state of the changed entity is evaluated. """
+        if entity_id not in self._entities:
+            return
+
+        if self._availability is not None:
+            self._availability.update(entity_id, new_state)
+
+        self._set_entity_on(entity_id, self._is_on(entity_id, new_state))
+        self._update_state()
+
+
+    #--------------------------------------------#
+    #       Overridable Private Methods
+    #--------------------------------------------#
+
+    def _get_entities(self, entity_ids: Union[Iterable[str], None] = None) -> set[str]:
+        """ Gets the entities to track, optionally only among the provided entities. """
+        return set()
+
+    def _is_on(self, entity_id: str, state: Union[State, None]) -> bool:
+        """ Determines whether the state of the entity counts as on. """
+        return state is not None and state.state == STATE_ON
+
+    def _update_state(self) -> None:
+        """ Updates the state from the entities that are on and the child registries. """
+        pass
+
+
+    #--------------------------------------------#
+    #       Private Methods
+    #--------------------------------------------#
+
+    def _get_entities_on(self, entity_ids: Union[Iterable[str], None] = None) -> set[str]:
+        """ Gets the entities that are on, optionally only among the provided entities. """
+        return { entity_id for entity_id in (self._entities if entity_ids is None else entity_ids) if self._is_on(entity_id, self.hass.states.get(entity_id)) }
+
+    def _reconcile_entities_on(self) -> None:
+        """ Applies only the entities that turned on or off since the restored entities that were on, so the last triggered entity is kept unless a new entity turned on. """
+        entities_on = self._get_entities_on()
+        baseline = self._restored_entities_on & self._entities
+        self._entities_on = set(baseline)
+        self._restored_entities_on = None
+
+        for entity_id in baseline - entities_on:
+            self._set_entity_on(entity_id, False)
+
+        for entity_id in entities_on - baseline:
+            self._set_entity_on(entity_id, True)
+
+        LOGGER.debug(f"Reconciled {self.entity_id} with {len(entities_on - baseline)} entities turned on and {len(baseline - entities_on)} turned off since the last stop.")
+
+    def _set_entity_on(self, entity_id: str, is_on: bool) -> None:
+        """ Adds the entity to or removes it from the entities that are on, remembering it as last triggered when it turns on. """
+        if not is_on:
+            self._entities_on.discard(entity_id)
+            return
+
+        if entity_id not in self._entities_on:
+            self._last_triggered = entity_id
+            self._entities_on.add(entity_id)
+
+
 #-----------------------------------------------------------#
 #       MA_SwitchEntity
 #-----------------------------------------------------------#
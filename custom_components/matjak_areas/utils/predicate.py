@@ -0,0 +1,157 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from __future__ import annotations
+from homeassistant.core import State
+from logging import getLogger, Logger
+from typing import Any, Callable, Union
+import operator
+import re
+
+
+#-----------------------------------------------------------#
+#       Types
+#-----------------------------------------------------------#
+
+Condition = tuple[str, Callable[[Any, Any], bool], Union[float, str]]
+
+
+#-----------------------------------------------------------#
+#       Constants
+#-----------------------------------------------------------#
+
+ANY_DOMAIN = "*"
+CONDITION_PATTERN = re.compile(r"^\s*([\w.]+)\s*(==|!=|>=|<=|>|<)\s*(.+?)\s*$")
+CONDITION_SEPARATOR = "&"
+DOMAIN_SEPARATOR = ":"
+LOGGER: Logger = getLogger(__name__)
+OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">=": operator.ge,
+    "<=": operator.le,
+    ">": operator.gt,
+    "<": operator.lt
+}
+
+
+#-----------------------------------------------------------#
+#       MA_StatePredicate
+#-----------------------------------------------------------#
+
+class MA_StatePredicate:
+    """ Matches states against rules compiled into per-domain lookups. A rule has the form "[domain:] state [& attribute op value]...", e.g. "on", "person: home" or "media_player: playing & volume_level > 0". """
+
+    #--------------------------------------------#
+    #       Constructor
+    #--------------------------------------------#
+
+    def __init__(self, rules: list[str]):
+        self._any_states: frozenset[str] = frozenset()
+        self._conditions: dict[str, dict[str, list[tuple[Condition, ...]]]] = {}
+        self._domain_states: dict[str, frozenset[str]] = {}
+        self._compile(rules)
+
+
+    #--------------------------------------------#
+    #       Methods
+    #--------------------------------------------#
+
+    def matches(self, entity_id: str, state: Union[State, None]) -> bool:
+        """ Determines whether the state of the entity matches any rule. """
+        if state is None:
+            return False
+
+        if state.state in self._any_states:
+            return True
+
+        domain = entity_id.partition(".")[0]
+
+        if state.state in self._domain_states.get(domain, ()):
+            return True
+
+        return self._matches_conditions(domain, state) or self._matches_conditions(ANY_DOMAIN, state)
+
+
+    #--------------------------------------------#
+    #       Private Methods
+    #--------------------------------------------#
+
+    def _compile(self, rules: list[str]) -> None:
+        """ Compiles the rules into frozensets of states per domain, and attribute conditions per domain and state. """
+        any_states: set[str] = set()
+        domain_states: dict[str, set[str]] = {}
+
+        for rule in rules:
+            domain, state, conditions = parse_rule(rule)
+
+            if len(conditions) > 0:
+                self._conditions.setdefault(domain or ANY_DOMAIN, {}).setdefault(state, []).append(conditions)
+            elif domain is None:
+                any_states.add(state)
+            else:
+                domain_states.setdefault(domain, set()).add(state)
+
+        self._any_states = frozenset(any_states)
+        self._domain_states = { domain: frozenset(states) for domain, states in domain_states.items() }
+
+    def _evaluate(self, condition: Condition, state: State) -> bool:
+        """ Evaluates an attribute condition against a state. Attributes that are missing or cannot be compared never match. """
+        attribute, compare, value = condition
+        actual = state.attributes.get(attribute, None)
+
+        if actual is None:
+            return False
+
+        try:
+            return compare(float(actual), value) if isinstance(value, float) else compare(str(actual), value)
+        except (TypeError, ValueError):
+            return False
+
+    def _matches_conditions(self, domain: str, state: State) -> bool:
+        """ Determines whether the state satisfies all attribute conditions of any rule of the domain and state. """
+        for conditions in self._conditions.get(domain, {}).get(state.state, ()):
+            if all(self._evaluate(condition, state) for condition in conditions):
+                return True
+
+        return False
+
+
+#-----------------------------------------------------------#
+#       Public Methods
+#-----------------------------------------------------------#
+
+def parse_rule(rule: str) -> tuple[Union[str, None], str, tuple[Condition, ...]]:
+    """ Parses a rule into its domain (None if any), state and attribute conditions. Raises a ValueError if the rule is invalid. """
+    state_part, *condition_parts = rule.split(CONDITION_SEPARATOR)
+    domain, separator, state = state_part.partition(DOMAIN_SEPARATOR)
+
+    if not separator:
+        domain, state = None, domain
+    else:
+        domain = domain.strip()
+
+    state = state.strip()
+
+    if not state or domain == "":
+        raise ValueError(f"Invalid rule {rule}.")
+
+    conditions = []
+
+    for condition_part in condition_parts:
+        match = CONDITION_PATTERN.match(condition_part)
+
+        if match is None:
+            raise ValueError(f"Invalid condition {condition_part.strip()} in rule {rule}.")
+
+        attribute, operator_symbol, value = match.groups()
+
+        try:
+            parsed_value: Union[float, str] = float(value)
+        except ValueError:
+            parsed_value = value.strip("\"'")
+
+        conditions.append((attribute, OPERATORS[operator_symbol], parsed_value))
+
+    return domain, state, tuple(conditions)
@@ -4,41 +4,247 @@
 
 from __future__ import annotations
 from .config import RegistryConfig
-from .functions import flatten_list
+from .debouncer import MA_Debouncer
+from .dispatcher import MA_Dispatcher
+from .slicer import MA_Slicer
+from .state_hub import EntityKey, MA_StateHub
 from .types import RemoveListener
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_DEVICE_CLASS
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers import entity_registry
+from homeassistant.core import callback, Event, HomeAssistant
+from homeassistant.helpers import device_registry, entity_registry
 from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
-from homeassistant.helpers.event import async_call_later
-from homeassistant.helpers.template import area_entities
 from logging import getLogger, Logger
-from types import MethodType
-from typing import Any, Callable, cast, Union
-import weakref
+from typing import Awaitable, Callable, Iterable, Union
 
 
 #-----------------------------------------------------------#
 #       Types
 #-----------------------------------------------------------#
 
-RegistryUpdateListener = Callable[[], None]
+ChildCountListener = Callable[[str], Awaitable[None]]
+EntityIndex = dict[str, dict[Union[str, None], set[str]]]
+RegistryUpdateListener = Callable[[set[str], set[str]], Awaitable[None]]
 
 
 #-----------------------------------------------------------#
 #       Constants
 #-----------------------------------------------------------#
 
+DEBOUNCE_MAX_WAIT: float = 10
+DEBOUNCE_QUIET_PERIOD: float = 1
+DEVICE_RELEVANT_CHANGES: list[str] = ["area_id", "config_entries", "disabled_by"]
+ENTITY_RELEVANT_CHANGES: list[str] = ["area_id", "config_entry_id", "device_class", "device_id", "disabled_by", "entity_id", "original_device_class"]
 LOGGER: Logger = getLogger(__name__)
+REBUILD_SLICE_TIME: float = 0.01
+
+
+#-----------------------------------------------------------#
+#       MA_AreaIndex
+#-----------------------------------------------------------#
+
+class MA_AreaIndex:
+    #--------------------------------------------#
+    #       Constructor
+    #--------------------------------------------#
+
+    def __init__(self):
+        self._area_entities: dict[str, set[str]] = {}
+        self._area_registries: dict[str, set[str]] = {}
+        self._device_areas: dict[str, Union[str, None]] = {}
+        self._device_entities: dict[str, set[str]] = {}
+        self._entity_areas: dict[str, str] = {}
+        self._entity_devices: dict[str, str] = {}
+        self._entity_registries: dict[str, set[str]] = {}
+        self._hass: HomeAssistant = None
+        self._included_registries: dict[str, set[str]] = {}
+
+
+    #--------------------------------------------#
+    #       Methods - Building
+    #--------------------------------------------#
+
+    def build(self, hass: HomeAssistant) -> None:
+        """ Builds the area index from the entity- and device registry. """
+        self._hass = hass
+        self._area_entities = {}
+        self._device_areas = { device.id: device.area_id for device in device_registry.async_get(hass).devices.values() }
+        self._device_entities = {}
+        self._entity_areas = {}
+        self._entity_devices = {}
+
+        for entry in entity_registry.async_get(hass).entities.values():
+            self._set_entity(entry.entity_id, entry)
+
+    def clear(self) -> None:
+        """ Clears the index. """
+        self.__init__()
+
+
+    #--------------------------------------------#
+    #       Methods - Registries
+    #--------------------------------------------#
+
+    def add_registry(self, registry: MA_Registry) -> None:
+        """ Adds a registry, mapping its areas and included entities to it. """
+        for area_id in registry.config.areas:
+            self._area_registries.setdefault(area_id, set()).add(registry.id)
+
+        for entity_id in registry.config.entities.include_entities:
+            self._included_registries.setdefault(entity_id, set()).add(registry.id)
+
+    def remove_registry(self, registry: MA_Registry) -> None:
+        """ Removes a registry and its entity ownership from the index. """
+        for area_id in registry.config.areas:
+            self._discard(self._area_registries, area_id, registry.id)
+
+        for entity_id in registry.config.entities.include_entities:
+            self._discard(self._included_registries, entity_id, registry.id)
+
+        for entity_id in registry.entities:
+            self.set_owner(entity_id, registry.id, False)
+
+    def set_owner(self, entity_id: str, registry_id: str, is_owner: bool) -> None:
+        """ Sets whether a registry tracks an entity. """
+        if is_owner:
+            self._entity_registries.setdefault(entity_id, set()).add(registry_id)
+        else:
+            self._discard(self._entity_registries, entity_id, registry_id)
+
+
+    #--------------------------------------------#
+    #       Methods - Getters
+    #--------------------------------------------#
+
+    def get_area_entities(self, area_id: str) -> set[str]:
+        """ Gets the entities located in an area, either directly or through their device. """
+        return self._area_entities.get(area_id, set())
+
+    def get_entity_area(self, entity_id: str) -> Union[str, None]:
+        """ Gets the area an entity is located in, either directly or through its device. """
+        return self._entity_areas.get(entity_id, None)
+
+    def get_affected_registries(self, entity_ids: Iterable[str]) -> dict[str, set[str]]:
+        """ Gets the ids of the registries that track, or might track, the entities, mapped to the entities affecting them. """
+        result: dict[str, set[str]] = {}
+
+        for entity_id in entity_ids:
+            registry_ids = self._entity_registries.get(entity_id, set()) | self._included_registries.get(entity_id, set()) | self._area_registries.get(self._entity_areas.get(entity_id, None), set())
+
+            for registry_id in registry_ids:
+                result.setdefault(registry_id, set()).add(entity_id)
+
+        return result
+
+
+    #--------------------------------------------#
+    #       Methods - Updating
+    #--------------------------------------------#
+
+    @callback
+    def is_relevant_event(self, event: Event) -> bool:
+        """ Determines whether a registry event can affect the index or any registry, based on its changes. """
+        if event.data.get("action") != "update" or "changes" not in event.data:
+            return True
+
+        relevant_changes = ENTITY_RELEVANT_CHANGES if event.event_type == EVENT_ENTITY_REGISTRY_UPDATED else DEVICE_RELEVANT_CHANGES
+        return any(key in relevant_changes for key in event.data["changes"])
+
+    def process_event(self, event: Event) -> Union[set[str], None]:
+        """ Applies a relevant registry event to the index. Returns the affected entities, or None if the event could not be resolved. """
+        action = event.data.get("action")
+
+        if event.event_type == EVENT_ENTITY_REGISTRY_UPDATED:
+            entity_id = event.data.get("entity_id")
+
+            if entity_id is None or action not in ["create", "remove", "update"]:
+                return None
+
+            result = { entity_id }
+
+            if action == "update" and "old_entity_id" in event.data:
+                result.add(event.data["old_entity_id"])
+
+            registry = entity_registry.async_get(self._hass)
+
+            for affected_entity_id in result:
+                self._set_entity(affected_entity_id, registry.async_get(affected_entity_id))
+
+            return result
+
+        if event.event_type == EVENT_DEVICE_REGISTRY_UPDATED:
+            device_id = event.data.get("device_id")
+
+            if device_id is None or action not in ["create", "remove", "update"]:
+                return None
+
+            device = device_registry.async_get(self._hass).async_get(device_id)
+
+            if device is None:
+                self._device_areas.pop(device_id, None)
+            else:
+                self._device_areas[device_id] = device.area_id
+
+            result = set(self._device_entities.get(device_id, ()))
+            registry = entity_registry.async_get(self._hass)
+
+            for entity_id in result:
+                self._set_entity(entity_id, registry.async_get(entity_id))
+
+            return result
+
+        return None
+
+
+    #--------------------------------------------#
+    #       Private Methods
+    #--------------------------------------------#
+
+    def _discard(self, mapping: dict[str, set[str]], key: str, value: str) -> None:
+        """ Discards a value from a set in a mapping, removing the set when empty. """
+        values = mapping.get(key, None)
+
+        if values is None:
+            return
+
+        values.discard(value)
+
+        if len(values) == 0:
+            del mapping[key]
+
+    def _set_entity(self, entity_id: str, entry: Union[entity_registry.RegistryEntry, None]) -> None:
+        """ Sets the device and area of an entity from its entity registry entry, inheriting the area of its device if not set. """
+        device_id = entry and entry.device_id
+        old_device_id = self._entity_devices.pop(entity_id, None)
+
+        if old_device_id is not None:
+            self._discard(self._device_entities, old_device_id, entity_id)
+
+        if device_id is not None:
+            self._device_entities.setdefault(device_id, set()).add(entity_id)
+            self._entity_devices[entity_id] = device_id
+
+        area_id = entry and (entry.area_id or self._device_areas.get(device_id, None))
+        old_area_id = self._entity_areas.pop(entity_id, None)
+
+        if old_area_id is not None:
+            self._discard(self._area_entities, old_area_id, entity_id)
+
+        if area_id is not None:
+            self._area_entities.setdefault(area_id, set()).add(entity_id)
+            self._entity_areas[entity_id] = area_id
 
 
 #-----------------------------------------------------------#
 #       Variables
 #-----------------------------------------------------------#
 
+_area_index: MA_AreaIndex = MA_AreaIndex()
+_parent_registries: dict[str, list[MA_Registry]] = {}
+_registry_debouncer: MA_Debouncer = None
 _registry_listener: RemoveListener = None
+_registry_slicer: MA_Slicer = None
 _registries: dict[str, MA_Registry] = {}
 
 
@@ -53,27 +259,63 @@ class MA_Registry:
 
     def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry):
         self._config: RegistryConfig = RegistryConfig(config_entry.options)
+        self._areas: frozenset[str] = frozenset(self._config.areas)
+        self._child_counts: dict[str, dict[str, int]] = {}
+        self._child_listeners: MA_Dispatcher = MA_Dispatcher(hass)
         self._config_entry: ConfigEntry = config_entry
-        self._entities: list[str] = self._process_entity_config(hass, config_entry, self._config)
+        self._counts: dict[str, int] = {}
+        self._entities: set[str] = set()
+        self._excluded_entity_ids: frozenset[str] = frozenset(self._config.entities.exclude_entities)
         self._hass: HomeAssistant = hass
-        self._listeners: list[RegistryUpdateListener] = []
+        self._included_entity_ids: frozenset[str] = frozenset(self._config.entities.include_entities)
+        self._index: EntityIndex = {}
+        self._index_keys: dict[str, EntityKey] = {}
+        self._index_stale: bool = True
+        self._listeners: MA_Dispatcher = MA_Dispatcher(hass)
         self._name: str = config_entry.title
+        self._state_hub: MA_StateHub = MA_StateHub(hass, lambda: self._entities, self.get_entity_key)
+        self._set_entities(self._process_entity_config())
 
 
     #--------------------------------------------#
     #       Properties
     #--------------------------------------------#
 
+    @property
+    def children(self) -> list[str]:
+        """ Gets the ids of the child registries. """
+        return self._config.children
+
     @property
     def config(self) -> RegistryConfig:
         """ Gets the registry config. """
         return self._config
 
+    @property
+    def counts(self) -> dict[str, int]:
+        """ Gets the published counts by key. """
+        return self._counts
+
+    @property
+    def entities(self) -> set[str]:
+        """ Gets the tracked entities. """
+        return self._entities
+
+    @property
+    def id(self) -> str:
+        """ Gets the id (the config entry id). """
+        return self._config_entry.entry_id
+
     @property
     def name(self) -> str:
         """ Gets the name. """
         return self._name
 
+    @property
+    def state_hub(self) -> MA_StateHub:
+        """ Gets the state hub, routing state changes of the entities to listeners by domain and device class. """
+        return self._state_hub
+
 
     #--------------------------------------------#
     #       Methods - Updating
@@ -81,69 +323,248 @@ class MA_Registry:
 
     def add_update_listener(self, listener: RegistryUpdateListener) -> RemoveListener:
         """ Adds an update listener. """
-        weak_listener = self._create_weak_listener(listener)
-        self._listeners.append(weak_listener)
-        return lambda: self._listeners.remove(weak_listener)
+        return self._listeners.add_listener(listener)
 
     def update_entities(self) -> None:
         """ Updates the entity list. """
-        self._entities = self._process_entity_config(self._hass, self._config_entry, self._config)
-        for listener in self._listeners:
-            self._hass.async_create_task(listener()())
+        self._replace_entities(self._process_entity_config())
+
+    async def async_update_entities(self, slicer: MA_Slicer) -> None:
+        """ Updates the entity list, yielding to the event loop between slices. """
+        registry = entity_registry.async_get(self._hass)
+        entities = set()
+
+        for entity_id in self._get_candidate_entity_ids():
+            if self._should_track_entity(registry, entity_id):
+                entities.add(entity_id)
+
+            await slicer.async_checkpoint()
+
+        self._replace_entities(entities)
+
+    async def async_update_entity_ids(self, entity_ids: Iterable[str], slicer: MA_Slicer) -> None:
+        """ Updates the entity list incrementally by reevaluating the provided entities, yielding to the event loop between slices. """
+        added, removed = set(), set()
+        registry = entity_registry.async_get(self._hass)
+
+        for entity_id in entity_ids:
+            self._update_entity(entity_id, self._should_track_entity(registry, entity_id), added, removed)
+            await slicer.async_checkpoint()
+
+        self._notify_listeners(added, removed)
+
+
+    #--------------------------------------------#
+    #       Methods - Counts
+    #--------------------------------------------#
+
+    def add_child_count_listener(self, listener: ChildCountListener) -> RemoveListener:
+        """ Adds a listener that is called with the key whenever a count of a child registry changes. """
+        return self._child_listeners.add_listener(listener)
+
+    def get_child_count(self, key: str) -> int:
+        """ Gets the sum of the counts of the child registries for the key. """
+        return sum(self._child_counts.get(key, {}).values())
+
+    def publish_count(self, key: str, count: int) -> None:
+        """ Publishes a count (e.g. the number of entities that are on) to the parent registries. """
+        if self._counts.get(key, None) == count:
+            return
+
+        self._counts[key] = count
+
+        for parent in get_parent_registries(self):
+            parent.set_child_count(self.id, key, count)
+
+    def remove_child(self, child_id: str) -> None:
+        """ Removes all counts of a child registry. """
+        for key, counts in self._child_counts.items():
+            if counts.pop(child_id, None) is not None:
+                self._child_listeners.dispatch(key)
+
+    def set_child_count(self, child_id: str, key: str, count: int) -> None:
+        """ Sets a count of a child registry. """
+        self._child_counts.setdefault(key, {})[child_id] = count
+        self._child_listeners.dispatch(key)
 
 
     #--------------------------------------------#
     #       Methods - Getters
     #--------------------------------------------#
 
-    def get_entities(self, domains: list[str] = [], device_classes: list[str] = []) -> list[str]:
-        """ Gets a list of entities. """
+    def filter_entities(self, entity_ids: Iterable[str], domains: list[str] = [], device_classes: list[str] = []) -> list[str]:
+        """ Filters a collection of tracked entities by domain and device class. """
         result = []
 
-        for entity_id in self._entities:
-            state = self._hass.states.get(entity_id)
+        for entity_id in entity_ids:
+            key = self._index_keys.get(entity_id, None)
 
-            if state is None:
+            if key is None or self._hass.states.get(entity_id) is None:
                 continue
 
-            if len(domains) > 0 and entity_id.split(".")[0] not in domains:
+            if len(domains) > 0 and key[0] not in domains:
                 continue
 
-            if len(device_classes) > 0:
-                if state.attributes.get(CONF_DEVICE_CLASS, None) not in device_classes:
-                    continue
+            if len(device_classes) > 0 and key[1] not in device_classes:
+                continue
 
             result.append(entity_id)
 
         return result
 
+    def get_entity_key(self, entity_id: str) -> Union[EntityKey, None]:
+        """ Gets the (domain, device class) key of a tracked entity. """
+        return self._index_keys.get(entity_id, None)
+
+    def get_entities(self, domains: list[str] = [], device_classes: list[str] = []) -> list[str]:
+        """ Gets a list of entities. """
+        if self._index_stale and self._hass.is_running:
+            self._build_index()
+
+        result = []
+
+        for domain in domains if len(domains) > 0 else self._index.keys():
+            domain_index = self._index.get(domain, {})
+
+            for device_class in device_classes if len(device_classes) > 0 else domain_index.keys():
+                for entity_id in domain_index.get(device_class, ()):
+                    if self._hass.states.get(entity_id) is not None:
+                        result.append(entity_id)
+
+        return result
+
 
     #--------------------------------------------#
     #       Private Methods
     #--------------------------------------------#
 
-    def _create_weak_listener(self, listener: Callable) -> Union[weakref.WeakMethod[MethodType], weakref.ref]:
-        """ Creates a weak listener from a listener. """
-        return weakref.WeakMethod(cast(MethodType, listener)) if hasattr(listener, "__self__") else weakref.ref(listener)
+    def _build_index(self) -> None:
+        """ Builds the (domain, device class) index of the entity list. """
+        self._index = {}
+        self._index_keys = {}
+        self._index_stale = not self._hass.is_running
+
+        for entity_id in self._entities:
+            self._index_entity(entity_id)
+
+    def _get_device_class(self, entity_id: str) -> Union[str, None]:
+        """ Gets the device class of an entity, preferring the state attribute over the entity registry. """
+        state = self._hass.states.get(entity_id)
+
+        if state is not None:
+            return state.attributes.get(CONF_DEVICE_CLASS, None)
+
+        entry = entity_registry.async_get(self._hass).async_get(entity_id)
+        return entry and (entry.device_class or entry.original_device_class)
+
+    def _index_entity(self, entity_id: str) -> None:
+        """ Adds an entity to the index, moving it if its device class has changed. """
+        key = (entity_id.split(".")[0], self._get_device_class(entity_id))
+
+        if self._index_keys.get(entity_id) == key:
+            return
+
+        self._unindex_entity(entity_id)
+        self._index.setdefault(key[0], {}).setdefault(key[1], set()).add(entity_id)
+        self._index_keys[entity_id] = key
+
+    def _unindex_entity(self, entity_id: str) -> None:
+        """ Removes an entity from the index. """
+        key = self._index_keys.pop(entity_id, None)
+
+        if key is None:
+            return
+
+        domain_index = self._index[key[0]]
+        domain_index[key[1]].discard(entity_id)
+
+        if len(domain_index[key[1]]) == 0:
+            del domain_index[key[1]]
+
+        if len(domain_index) == 0:
+            del self._index[key[0]]
+
+    def _notify_listeners(self, added: set[str], removed: set[str]) -> None:
+        """ Notifies the update listeners of the added and removed entities. Entities that were reindexed are contained in both. """
+        if len(added) == 0 and len(removed) == 0:
+            return
+
+        self._state_hub.update_entities(added, removed)
+        self._listeners.dispatch(added, removed)
+
+    def _replace_entities(self, entities: set[str]) -> None:
+        """ Replaces the entity list, notifying the listeners of the difference. """
+        old_index_keys = self._index_keys
+        self._set_entities(entities)
+
+        added = { entity_id for entity_id, key in self._index_keys.items() if old_index_keys.get(entity_id) != key }
+        removed = { entity_id for entity_id, key in old_index_keys.items() if self._index_keys.get(entity_id) != key }
+        self._notify_listeners(added, removed)
+
+    def _set_entities(self, entities: set[str]) -> None:
+        """ Sets the entity list, updating the index and the entity ownership of the area index. """
+        for entity_id in self._entities - entities:
+            _area_index.set_owner(entity_id, self.id, False)
+
+        for entity_id in entities - self._entities:
+            _area_index.set_owner(entity_id, self.id, True)
 
-    def _process_entity_config(self, hass: HomeAssistant, config_entry: ConfigEntry, config: RegistryConfig) -> list[str]:
-        """ Processes the entity configuration, resulting a list of entities. """
-        area_entity_ids = flatten_list([area_entities(hass, area) for area in config.areas])
-        excluded_entity_ids = config.entities.exclude_entities
-        included_entity_ids = config.entities.include_entities
-        entry_entity_ids = [entry.entity_id for entry in entity_registry.async_entries_for_config_entry(entity_registry.async_get(hass), config_entry.entry_id)]
-        filtered_area_entity_ids = [entity_id for entity_id in area_entity_ids if entity_id not in excluded_entity_ids + entry_entity_ids]
-        entities = filtered_area_entity_ids + included_entity_ids
+        self._entities = entities
 
-        # check disabled devices?
+        self._build_index()
 
-        for entity_id in entities:
-            entity = entity_registry.async_get(hass).async_get(entity_id)
+    def _should_track_entity(self, registry: entity_registry.EntityRegistry, entity_id: str) -> bool:
+        """ Determines whether an entity should be tracked by the registry, using the same rules as the entity configuration. """
+        entry = registry.async_get(entity_id)
 
-            if entity is not None and entity.disabled:
-                entities.remove(entity_id)
+        if entry is not None and entry.disabled:
+            return False
 
-        return entities
+        if entity_id in self._included_entity_ids:
+            return True
+
+        if entry is None or entity_id in self._excluded_entity_ids:
+            return False
+
+        if entry.config_entry_id == self._config_entry.entry_id:
+            return False
+
+        return _area_index.get_entity_area(entity_id) in self._areas
+
+    def _update_entity(self, entity_id: str, track: bool, added: set[str], removed: set[str]) -> None:
+        """ Adds, reindexes or removes an entity from the entity list, recording the change in the added and removed sets. """
+        key = self._index_keys.get(entity_id, None)
+
+        if not track:
+            if entity_id not in self._entities:
+                return
+
+            self._entities.discard(entity_id)
+            self._unindex_entity(entity_id)
+            _area_index.set_owner(entity_id, self.id, False)
+            removed.add(entity_id)
+            return
+
+        if entity_id not in self._entities:
+            self._entities.add(entity_id)
+            _area_index.set_owner(entity_id, self.id, True)
+
+        self._index_entity(entity_id)
+
+        if self._index_keys.get(entity_id) != key:
+            if key is not None:
+                removed.add(entity_id)
+
+            added.add(entity_id)
+
+    def _get_candidate_entity_ids(self) -> frozenset[str]:
+        """ Gets the entities in the areas and the included entities. """
+        return frozenset().union(*[_area_index.get_area_entities(area) for area in self._areas], self._included_entity_ids)
+
+    def _process_entity_config(self) -> set[str]:
+        """ Processes the entity configuration, resulting in a set of entities. """
+        registry = entity_registry.async_get(self._hass)
+        return { entity_id for entity_id in self._get_candidate_entity_ids() if self._should_track_entity(registry, entity_id) }
 
 
 #-----------------------------------------------------------#
@@ -155,67 +576,165 @@ def create_registry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
     global _registry_listener
 
     if _registry_listener is None:
+        _area_index.build(hass)
         _registry_listener = setup_listeners(hass)
 
-    _registries[config_entry.entry_id] = MA_Registry(hass, config_entry)
+    registry = MA_Registry(hass, config_entry)
+    _area_index.add_registry(registry)
+    _registries[config_entry.entry_id] = registry
+    _parent_registries.clear()
+
+    for child_id in registry.children:
+        child = _registries.get(child_id, None)
+
+        if child is not None and registry in get_parent_registries(child):
+            for key, count in child.counts.items():
+                registry.set_child_count(child.id, key, count)
+
+def get_parent_registries(registry: MA_Registry) -> list[MA_Registry]:
+    """ Gets the registries that have the registry as a child, ignoring links that would form a cycle. """
+    if registry.id not in _parent_registries:
+        descendant_ids = _get_descendant_ids(registry.id)
+        _parent_registries[registry.id] = [parent for parent in _registries.values() if registry.id in parent.children and parent.id not in descendant_ids]
+
+    return _parent_registries[registry.id]
 
 def get_registry(config_entry: ConfigEntry) -> MA_Registry:
     """ Gets a registry. """
     return _registries.get(config_entry.entry_id, None)
 
+def get_registry_debouncer() -> MA_Debouncer:
+    """ Gets the debouncer of the registry listener, exposing its counters. """
+    return _registry_debouncer
+
+def get_registry_slicer() -> MA_Slicer:
+    """ Gets the slicer of the registry listener, exposing the loop-blocking time of each slice of the last reload. """
+    return _registry_slicer
+
+async def async_rebuild_registries(hass: HomeAssistant) -> None:
+    """ Rebuilds the area index and the entities of all registries once, yielding to the event loop between slices. """
+    if len(_registries) == 0:
+        return
+
+    slicer = MA_Slicer(REBUILD_SLICE_TIME)
+    _area_index.build(hass)
+
+    for registry in list(_registries.values()):
+        await registry.async_update_entities(slicer)
+        await slicer.async_checkpoint()
+
+    slicer.finish()
+    LOGGER.debug(f"Rebuilt {len(_registries)} MA_Registry in {len(slicer.slice_times)} slices, blocking the event loop for at most {slicer.max_slice_time * 1000:.1f} ms.")
+
 def remove_registry(config_entry: ConfigEntry) -> None:
     """ Removes a registry """
     global _registry_listener
-    _registries.pop(config_entry.entry_id, None)
+    registry = _registries.pop(config_entry.entry_id, None)
+
+    if registry is not None:
+        _area_index.remove_registry(registry)
+
+        for parent in get_parent_registries(registry):
+            parent.remove_child(registry.id)
+
+    _parent_registries.clear()
 
     if len(_registries) == 0:
         _registry_listener()
         _registry_listener = None
+        _area_index.clear()
 
 
 #-----------------------------------------------------------#
 #       Private Methods
 #-----------------------------------------------------------#
 
-def setup_listeners(hass: HomeAssistant):
-    """ Sets up the registry listener. """
-    debounce_listener = None
-    debounce_time = 1
+def _get_descendant_ids(registry_id: str) -> set[str]:
+    """ Gets the ids of the loaded registries below the registry, including itself. """
+    result: set[str] = set()
+    pending = [registry_id]
+
+    while pending:
+        current_id = pending.pop()
+
+        if current_id in result:
+            continue
+
+        result.add(current_id)
+        current = _registries.get(current_id, None)
+
+        if current is not None:
+            pending.extend(current.children)
+
+    return result
+
+def setup_listeners(hass: HomeAssistant, quiet_period: float = DEBOUNCE_QUIET_PERIOD, max_wait: float = DEBOUNCE_MAX_WAIT, slice_time: Union[float, None] = REBUILD_SLICE_TIME):
+    """ Sets up the registry listener. Registries are updated cooperatively in slices of the slice time, or in one go if it is None. """
+    global _registry_debouncer, _registry_slicer
+    dirty_registries: dict[str, Union[set[str], None]] = {}
+    is_index_stale = False
     registry_listeners = []
-    should_reload = True
 
-    async def async_reload(*args: Any) -> None:
-        nonlocal should_reload
-        LOGGER.debug("Entity- or Device registry was updated. Updating MA_Registry.")
-        should_reload = False
+    async def async_reload() -> None:
+        nonlocal is_index_stale
+        LOGGER.debug(f"Entity- or Device registry was updated ({debouncer.last_coalesced} events coalesced). Updating {len(dirty_registries)} MA_Registry.")
+        registries = dirty_registries.copy()
+        dirty_registries.clear()
+        slicer.reset()
 
-        for registry in _registries.values():
-            registry.update_entities()
+        if is_index_stale:
+            _area_index.build(hass)
+            is_index_stale = False
 
-        should_reload = True
+        for registry_id, entity_ids in registries.items():
+            registry = _registries.get(registry_id, None)
 
-    async def async_on_registry_update(*args: Any) -> None:
-        nonlocal debounce_listener, debounce_time, should_reload
+            if registry is None:
+                continue
+
+            if entity_ids is None:
+                await registry.async_update_entities(slicer)
+            else:
+                await registry.async_update_entity_ids(entity_ids, slicer)
+
+            await slicer.async_checkpoint()
+
+        slicer.finish()
+        LOGGER.debug(f"Updated MA_Registry in {len(slicer.slice_times)} slices, blocking the event loop for at most {slicer.max_slice_time * 1000:.1f} ms.")
+
+    async def async_on_registry_update(event: Event) -> None:
+        nonlocal is_index_stale
+        entity_ids = _area_index.process_event(event)
 
         if not hass.is_running:
             return
 
-        if not should_reload:
-            return
+        if entity_ids is None:
+            is_index_stale = True
+            dirty_registries.update({ registry_id: None for registry_id in _registries.keys() })
+        else:
+            for registry_id, registry_entity_ids in _area_index.get_affected_registries(entity_ids).items():
+                if registry_id not in dirty_registries:
+                    dirty_registries[registry_id] = set()
 
-        if debounce_listener:
-            debounce_listener()
+                if dirty_registries[registry_id] is not None:
+                    dirty_registries[registry_id].update(registry_entity_ids)
 
-        debounce_listener = async_call_later(hass, debounce_time, async_reload)
+        if len(dirty_registries) > 0:
+            debouncer.async_call()
 
     def remove_listeners() -> None:
-        if debounce_listener:
-            debounce_listener()
+        global _registry_debouncer, _registry_slicer
+        debouncer.async_cancel()
+        _registry_debouncer = None
+        _registry_slicer = None
 
         while registry_listeners:
             registry_listeners.pop()()
 
-    registry_listeners.append(hass.bus.async_listen(EVENT_DEVICE_REGISTRY_UPDATED, async_on_registry_update))
-    registry_listeners.append(hass.bus.async_listen(EVENT_ENTITY_REGISTRY_UPDATED, async_on_registry_update))
+    debouncer = _registry_debouncer = MA_Debouncer(hass, async_reload, quiet_period, max_wait)
+    slicer = _registry_slicer = MA_Slicer(slice_time)
+    registry_listeners.append(hass.bus.async_listen(EVENT_DEVICE_REGISTRY_UPDATED, async_on_registry_update, event_filter=_area_index.is_relevant_event))
+    registry_listeners.append(hass.bus.async_listen(EVENT_ENTITY_REGISTRY_UPDATED, async_on_registry_update, event_filter=_area_index.is_relevant_event))
 
-    return lambda: remove_listeners()
\ No newline at end of file
+    return lambda: remove_listeners()
@@ -0,0 +1,79 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from __future__ import annotations
+from logging import getLogger, Logger
+from typing import Union
+import asyncio
+import time
+
+
+#-----------------------------------------------------------#
+#       Constants
+#-----------------------------------------------------------#
+
+LOGGER: Logger = getLogger(__name__)
+
+
+#-----------------------------------------------------------#
+#       MA_Slicer
+#-----------------------------------------------------------#
+
+class MA_Slicer:
+    #--------------------------------------------#
+    #       Constructor
+    #--------------------------------------------#
+
+    def __init__(self, slice_time: Union[float, None]):
+        self._slice_start: float = time.perf_counter()
+        self._slice_time: Union[float, None] = slice_time
+        self._slice_times: list[float] = []
+
+
+    #--------------------------------------------#
+    #       Properties
+    #--------------------------------------------#
+
+    @property
+    def max_slice_time(self) -> float:
+        """ Gets the longest time (in seconds) the event loop was blocked by a slice. """
+        return max(self._slice_times, default=0)
+
+    @property
+    def slice_times(self) -> list[float]:
+        """ Gets the time (in seconds) the event loop was blocked by each slice since the last reset. """
+        return self._slice_times
+
+
+    #--------------------------------------------#
+    #       Methods
+    #--------------------------------------------#
+
+    async def async_checkpoint(self) -> None:
+        """ Yields to the event loop if the current slice has exceeded the slice time. Never yields if the slice time is None. """
+        if self._slice_time is None:
+            return
+
+        if time.perf_counter() - self._slice_start >= self._slice_time:
+            self._end_slice()
+            await asyncio.sleep(0)
+            self._slice_start = time.perf_counter()
+
+    def finish(self) -> None:
+        """ Ends the current slice. """
+        self._end_slice()
+
+    def reset(self) -> None:
+        """ Resets the slice times and starts a new slice. """
+        self._slice_times = []
+        self._slice_start = time.perf_counter()
+
+
+    #--------------------------------------------#
+    #       Private Methods
+    #--------------------------------------------#
+
+    def _end_slice(self) -> None:
+        """ Records the time of the current slice. """
+        self._slice_times.append(time.perf_counter() - self._slice_start)
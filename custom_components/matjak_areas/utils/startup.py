@@ -0,0 +1,120 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from __future__ import annotations
+from .registry import async_rebuild_registries, REBUILD_SLICE_TIME
+from .slicer import MA_Slicer
+from .types import RemoveListener
+from homeassistant.const import EVENT_HOMEASSISTANT_START
+from homeassistant.core import Event, HomeAssistant
+from itertools import count
+from logging import getLogger, Logger
+from typing import Awaitable, Callable, Union
+
+
+#-----------------------------------------------------------#
+#       Types
+#-----------------------------------------------------------#
+
+StartupListener = Callable[[], Awaitable[None]]
+
+
+#-----------------------------------------------------------#
+#       Constants
+#-----------------------------------------------------------#
+
+LOGGER: Logger = getLogger(__name__)
+
+
+#-----------------------------------------------------------#
+#       Variables
+#-----------------------------------------------------------#
+
+_startup_barrier: Union[MA_StartupBarrier, None] = None
+
+
+#-----------------------------------------------------------#
+#       MA_StartupBarrier
+#-----------------------------------------------------------#
+
+class MA_StartupBarrier:
+    #--------------------------------------------#
+    #       Constructor
+    #--------------------------------------------#
+
+    def __init__(self, hass: HomeAssistant):
+        self._hass: HomeAssistant = hass
+        self._is_listening: bool = False
+        self._keys = count()
+        self._listeners: dict[int, StartupListener] = {}
+
+
+    #--------------------------------------------#
+    #       Properties
+    #--------------------------------------------#
+
+    @property
+    def hass(self) -> HomeAssistant:
+        """ Gets the HomeAssistant instance. """
+        return self._hass
+
+    @property
+    def listener_count(self) -> int:
+        """ Gets the number of listeners waiting for HomeAssistant to start. """
+        return len(self._listeners)
+
+
+    #--------------------------------------------#
+    #       Methods
+    #--------------------------------------------#
+
+    def add_listener(self, listener: StartupListener) -> RemoveListener:
+        """ Adds a listener that is called once HomeAssistant has started and the registries have been rebuilt. """
+        key = next(self._keys)
+        self._listeners[key] = listener
+
+        if not self._is_listening:
+            self._hass.bus.async_listen_once(EVENT_HOMEASSISTANT_START, self._async_on_start)
+            self._is_listening = True
+
+        return lambda: self._listeners.pop(key, None)
+
+
+    #--------------------------------------------#
+    #       Private Methods
+    #--------------------------------------------#
+
+    async def _async_on_start(self, event: Event) -> None:
+        """ Rebuilds the registries once and then calls all listeners in one pass, yielding to the event loop between slices. """
+        self._is_listening = False
+        await async_rebuild_registries(self._hass)
+
+        slicer = MA_Slicer(REBUILD_SLICE_TIME)
+        listeners = list(self._listeners.values())
+        self._listeners.clear()
+
+        for listener in listeners:
+            try:
+                await listener()
+            except Exception:
+                LOGGER.exception(f"Error calling startup listener {listener}.")
+
+            await slicer.async_checkpoint()
+
+        slicer.finish()
+        LOGGER.debug(f"Set up {len(listeners)} entities in {len(slicer.slice_times)} slices, blocking the event loop for at most {slicer.max_slice_time * 1000:.1f} ms.")
+
+
+#-----------------------------------------------------------#
+#       Public Methods
+#-----------------------------------------------------------#
+
+def get_startup_barrier(hass: HomeAssistant) -> MA_StartupBarrier:
+    """ Gets the startup barrier shared by all entities of the integration. """
+    global _startup_barrier
+
+    if _startup_barrier is None or _startup_barrier.hass is not hass:
+        _startup_barrier = MA_StartupBarrier(hass)
+
+    return _startup_barrier
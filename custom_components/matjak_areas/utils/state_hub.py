@@ -0,0 +1,156 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from __future__ import annotations
+from .types import RemoveListener
+from homeassistant.core import callback, Event, HomeAssistant, State
+from homeassistant.helpers.event import async_track_state_change_event
+from itertools import count
+from logging import getLogger, Logger
+from typing import Awaitable, Callable, Iterable, Union
+
+
+#-----------------------------------------------------------#
+#       Types
+#-----------------------------------------------------------#
+
+EntityKey = tuple[str, Union[str, None]]
+StateChangeListener = Callable[[str, Union[State, None], Union[State, None]], Awaitable[None]]
+
+
+#-----------------------------------------------------------#
+#       Constants
+#-----------------------------------------------------------#
+
+ANY_DEVICE_CLASS = "*"
+LOGGER: Logger = getLogger(__name__)
+
+
+#-----------------------------------------------------------#
+#       MA_StateHub
+#-----------------------------------------------------------#
+
+class MA_StateHub:
+    #--------------------------------------------#
+    #       Constructor
+    #--------------------------------------------#
+
+    def __init__(self, hass: HomeAssistant, get_entities: Callable[[], Iterable[str]], get_entity_key: Callable[[str], Union[EntityKey, None]]):
+        self._get_entities: Callable[[], Iterable[str]] = get_entities
+        self._get_entity_key: Callable[[str], Union[EntityKey, None]] = get_entity_key
+        self._hass: HomeAssistant = hass
+        self._keys = count()
+        self._routes: dict[EntityKey, dict[int, StateChangeListener]] = {}
+        self._trackers: dict[str, RemoveListener] = {}
+
+
+    #--------------------------------------------#
+    #       Properties
+    #--------------------------------------------#
+
+    @property
+    def listener_count(self) -> int:
+        """ Gets the number of listeners. """
+        return len({ key for listeners in self._routes.values() for key in listeners })
+
+    @property
+    def tracker_count(self) -> int:
+        """ Gets the number of state trackers. """
+        return len(self._trackers)
+
+
+    #--------------------------------------------#
+    #       Methods
+    #--------------------------------------------#
+
+    def add_listener(self, listener: StateChangeListener, device_classes: dict[str, list[str]]) -> RemoveListener:
+        """ Adds a listener for state changes of the entities matching the domains and device classes (all device classes of a domain if empty). Only entities matching a route are tracked. """
+        key = next(self._keys)
+        routes = [(domain, device_class) for domain, domain_device_classes in device_classes.items() for device_class in domain_device_classes or [ANY_DEVICE_CLASS]]
+        is_new_route = any(route not in self._routes for route in routes)
+
+        for route in routes:
+            self._routes.setdefault(route, {})[key] = listener
+
+        if is_new_route:
+            self._refresh_trackers()
+
+        def remove_listener() -> None:
+            is_route_removed = False
+
+            for route in routes:
+                listeners = self._routes.get(route, {})
+                listeners.pop(key, None)
+
+                if len(listeners) == 0 and self._routes.pop(route, None) is not None:
+                    is_route_removed = True
+
+            if is_route_removed:
+                self._refresh_trackers()
+
+        return remove_listener
+
+    def update_entities(self, added: set[str], removed: set[str]) -> None:
+        """ Updates the tracked entities. Entities that were reindexed are contained in both added and removed and are matched against the routes again. """
+        if len(self._routes) == 0:
+            return
+
+        self._untrack_entities(entity_id for entity_id in removed | added if entity_id not in added or not self._matches(entity_id))
+        self._track_entities(entity_id for entity_id in added if self._matches(entity_id))
+
+
+    #--------------------------------------------#
+    #       Private Methods
+    #--------------------------------------------#
+
+    async def _async_notify(self, listeners: list[StateChangeListener], entity_id: str, old_state: Union[State, None], new_state: Union[State, None]) -> None:
+        """ Calls the listeners with the state change. """
+        for listener in listeners:
+            try:
+                await listener(entity_id, old_state, new_state)
+            except Exception:
+                LOGGER.exception(f"Error calling state listener {listener} for {entity_id}.")
+
+    def _get_listeners(self, entity_id: str) -> list[StateChangeListener]:
+        """ Gets the listeners of the routes matching the domain and device class of the entity. """
+        key = self._get_entity_key(entity_id)
+
+        if key is None:
+            return []
+
+        return list({ **self._routes.get((key[0], ANY_DEVICE_CLASS), {}), **self._routes.get(key, {}) }.values())
+
+    def _matches(self, entity_id: str) -> bool:
+        """ Determines whether a route matches the domain and device class of the entity. """
+        key = self._get_entity_key(entity_id)
+        return key is not None and (key in self._routes or (key[0], ANY_DEVICE_CLASS) in self._routes)
+
+    @callback
+    def _on_state_change_event(self, event: Event) -> None:
+        """ Routes a state change to the listeners of the domain and device class of the entity. A task is only created if a listener matches. """
+        entity_id = event.data["entity_id"]
+        listeners = self._get_listeners(entity_id)
+
+        if len(listeners) > 0:
+            self._hass.async_create_task(self._async_notify(listeners, entity_id, event.data.get("old_state"), event.data.get("new_state")))
+
+    def _refresh_trackers(self) -> None:
+        """ Tracks exactly the entities matching a route, after the routes have changed. """
+        entity_ids = { entity_id for entity_id in self._get_entities() if self._matches(entity_id) }
+        self._untrack_entities([entity_id for entity_id in self._trackers if entity_id not in entity_ids])
+        self._track_entities(entity_ids)
+
+    def _track_entities(self, entity_ids: Iterable[str]) -> None:
+        """ Subscribes to state changes of the entities. """
+        for entity_id in entity_ids:
+            if entity_id not in self._trackers:
+                self._trackers[entity_id] = async_track_state_change_event(self._hass, [entity_id], self._on_state_change_event)
+
+    def _untrack_entities(self, entity_ids: Iterable[str]) -> None:
+        """ Unsubscribes from state changes of the entities. """
+        for entity_id in entity_ids:
+            remove_tracker = self._trackers.pop(entity_id, None)
+
+            if remove_tracker:
+                remove_tracker()
@@ -0,0 +1,79 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from __future__ import annotations
+from homeassistant.helpers.typing import StateType
+from typing import Union
+
+
+#-----------------------------------------------------------#
+#       MA_Throttle
+#-----------------------------------------------------------#
+
+class MA_Throttle:
+    """ Decides when a numeric value is published. A significant change (exceeding both the absolute and the relative threshold) is published once the minimum interval has passed since the last publish, any other change only once the value is older than the max staleness. A threshold, interval or staleness of 0 is disabled. """
+
+    #--------------------------------------------#
+    #       Constructor
+    #--------------------------------------------#
+
+    def __init__(self, min_interval: float = 0, absolute_threshold: float = 0, relative_threshold: float = 0, max_staleness: float = 0):
+        self._absolute_threshold: float = absolute_threshold
+        self._max_staleness: float = max_staleness
+        self._min_interval: float = min_interval
+        self._published_at: float = 0
+        self._published_value: StateType = None
+        self._relative_threshold: float = relative_threshold
+
+
+    #--------------------------------------------#
+    #       Properties
+    #--------------------------------------------#
+
+    @property
+    def published_value(self) -> StateType:
+        """ Gets the value that was published last. """
+        return self._published_value
+
+
+    #--------------------------------------------#
+    #       Methods
+    #--------------------------------------------#
+
+    def get_delay(self, value: StateType, now: float) -> Union[float, None]:
+        """ Gets the time (in seconds) until the value may be published, 0 if it can be published now, or None if it does not need to be published. """
+        if value == self._published_value:
+            return None
+
+        if not isinstance(value, (float, int)) or not isinstance(self._published_value, (float, int)):
+            return 0
+
+        elapsed = now - self._published_at
+
+        if self._is_significant(value):
+            return max(self._min_interval - elapsed, 0)
+
+        if self._max_staleness > 0:
+            return max(self._max_staleness - elapsed, self._min_interval - elapsed, 0)
+
+        return None
+
+    def mark_published(self, value: StateType, now: float) -> None:
+        """ Records that the value has been published. """
+        self._published_at = now
+        self._published_value = value
+
+
+    #--------------------------------------------#
+    #       Private Methods
+    #--------------------------------------------#
+
+    def _is_significant(self, value: float) -> bool:
+        """ Determines whether the value differs enough from the published value. """
+        change = abs(value - self._published_value)
+
+        if change < self._absolute_threshold:
+            return False
+
+        return change * 100 >= self._relative_threshold * abs(self._published_value)
@@ -0,0 +1,159 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from __future__ import annotations
+from .types import Callback
+from homeassistant.core import HomeAssistant
+from itertools import count
+from logging import getLogger, Logger
+from typing import Union
+import asyncio
+import heapq
+
+
+#-----------------------------------------------------------#
+#       Constants
+#-----------------------------------------------------------#
+
+COMPACT_THRESHOLD = 64
+LOGGER: Logger = getLogger(__name__)
+NAMESPACE_SEPARATOR = ":"
+
+
+#-----------------------------------------------------------#
+#       Variables
+#-----------------------------------------------------------#
+
+_timers: Union[MA_Timers, None] = None
+
+
+#-----------------------------------------------------------#
+#       MA_Timers
+#-----------------------------------------------------------#
+
+class MA_Timers:
+    #--------------------------------------------#
+    #       Constructor
+    #--------------------------------------------#
+
+    def __init__(self, hass: HomeAssistant):
+        self._deadlines: dict[str, tuple[float, int, Callback]] = {}
+        self._hass: HomeAssistant = hass
+        self._heap: list[tuple[float, int, str]] = []
+        self._sequence = count()
+        self._timer: Union[asyncio.TimerHandle, None] = None
+        self._timer_deadline: float = 0
+
+
+    #--------------------------------------------#
+    #       Properties
+    #--------------------------------------------#
+
+    @property
+    def hass(self) -> HomeAssistant:
+        """ Gets the HomeAssistant instance. """
+        return self._hass
+
+    @property
+    def pending_count(self) -> int:
+        """ Gets the number of pending timers. """
+        return len(self._deadlines)
+
+
+    #--------------------------------------------#
+    #       Methods
+    #--------------------------------------------#
+
+    def cancel(self, key: str) -> None:
+        """ Cancels the timer of the key. The loop timer is left in place and simply finds nothing to run. """
+        self._deadlines.pop(key, None)
+
+    def get_pending_count(self, namespace: str) -> int:
+        """ Gets the number of pending timers whose key is in the namespace, see get_key. """
+        prefix = f"{namespace}{NAMESPACE_SEPARATOR}"
+        return sum(1 for key in self._deadlines if key.startswith(prefix))
+
+    def get_remaining(self, key: str) -> Union[float, None]:
+        """ Gets the time (in seconds) until the timer of the key expires, or None if no timer is pending. """
+        entry = self._deadlines.get(key, None)
+        return None if entry is None else max(entry[0] - self._hass.loop.time(), 0)
+
+    def is_scheduled(self, key: str) -> bool:
+        """ Determines whether a timer is pending for the key. """
+        return key in self._deadlines
+
+    def schedule(self, key: str, delay: float, callback: Callback) -> None:
+        """ Schedules the callback to be called after the delay (in seconds), replacing a pending timer of the key. """
+        deadline = self._hass.loop.time() + delay
+        sequence = next(self._sequence)
+        self._deadlines[key] = (deadline, sequence, callback)
+        heapq.heappush(self._heap, (deadline, sequence, key))
+
+        if len(self._heap) > 2 * len(self._deadlines) + COMPACT_THRESHOLD:
+            self._compact()
+
+        if self._timer is None or deadline < self._timer_deadline:
+            self._arm(deadline)
+
+
+    #--------------------------------------------#
+    #       Private Methods
+    #--------------------------------------------#
+
+    def _arm(self, deadline: float) -> None:
+        """ Arms the loop timer for the deadline. """
+        if self._timer:
+            self._timer.cancel()
+
+        self._timer = self._hass.loop.call_at(deadline, self._on_timer)
+        self._timer_deadline = deadline
+
+    def _compact(self) -> None:
+        """ Rebuilds the heap from the pending timers, dropping entries of cancelled or replaced timers. """
+        self._heap = [(deadline, sequence, key) for key, (deadline, sequence, _) in self._deadlines.items()]
+        heapq.heapify(self._heap)
+
+    def _is_stale(self, item: tuple[float, int, str]) -> bool:
+        """ Determines whether a heap entry belongs to a cancelled or replaced timer. """
+        entry = self._deadlines.get(item[2], None)
+        return entry is None or entry[1] != item[1]
+
+    def _on_timer(self) -> None:
+        """ Runs the callbacks of all expired timers and re-arms the loop timer for the next deadline, which may be earlier than a deadline armed by a callback. """
+        self._timer = None
+        now = self._hass.loop.time()
+
+        while self._heap and (self._heap[0][0] <= now or self._is_stale(self._heap[0])):
+            item = heapq.heappop(self._heap)
+
+            if self._is_stale(item):
+                continue
+
+            _, _, callback = self._deadlines.pop(item[2])
+
+            try:
+                callback()
+            except Exception:
+                LOGGER.exception(f"Error calling timer callback {callback}.")
+
+        if self._heap and (self._timer is None or self._heap[0][0] < self._timer_deadline):
+            self._arm(self._heap[0][0])
+
+
+#-----------------------------------------------------------#
+#       Public Methods
+#-----------------------------------------------------------#
+
+def get_key(namespace: str, key: str) -> str:
+    """ Gets a timer key in the namespace, so the pending timers of the namespace can be counted. """
+    return f"{namespace}{NAMESPACE_SEPARATOR}{key}"
+
+def get_timers(hass: HomeAssistant) -> MA_Timers:
+    """ Gets the timers shared by all entities of the integration. """
+    global _timers
+
+    if _timers is None or _timers.hass is not hass:
+        _timers = MA_Timers(hass)
+
+    return _timers
@@ -0,0 +1,121 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from __future__ import annotations
+from math import floor, fsum
+from typing import Union
+
+
+#-----------------------------------------------------------#
+#       Constants
+#-----------------------------------------------------------#
+
+BUCKET_COUNT = 60
+
+
+#-----------------------------------------------------------#
+#       MA_TimeWindow
+#-----------------------------------------------------------#
+
+class MA_TimeWindow:
+    """ Computes the time-weighted average of a value over a sliding window. The window is split into a fixed ring of buckets holding the integral of the value and the covered time, so memory is bounded by the bucket count instead of the sample rate. Time without a value is not covered. The totals are updated incrementally as samples arrive and buckets age out. """
+
+    #--------------------------------------------#
+    #       Constructor
+    #--------------------------------------------#
+
+    def __init__(self, window: float, bucket_count: int = BUCKET_COUNT):
+        self._areas: list[float] = [0.0] * bucket_count
+        self._bucket: int = 0
+        self._bucket_count: int = bucket_count
+        self._bucket_width: float = window / bucket_count
+        self._durations: list[float] = [0.0] * bucket_count
+        self._last_time: Union[float, None] = None
+        self._last_value: Union[float, None] = None
+        self._total_area: float = 0
+        self._total_duration: float = 0
+
+
+    #--------------------------------------------#
+    #       Properties
+    #--------------------------------------------#
+
+    @property
+    def bucket_width(self) -> float:
+        """ Gets the time (in seconds) covered by a bucket. """
+        return self._bucket_width
+
+
+    #--------------------------------------------#
+    #       Methods
+    #--------------------------------------------#
+
+    def add(self, value: Union[float, None], now: float) -> None:
+        """ Adds a sample, which holds until the next sample. A value of None means there is no value. """
+        self._advance(now)
+        self._last_value = value
+
+    def get_average(self, now: float) -> Union[float, None]:
+        """ Gets the time-weighted average over the window, or the last value if no time has been covered yet. """
+        self._advance(now)
+
+        if self._total_duration <= 0:
+            return self._last_value
+
+        return self._total_area / self._total_duration
+
+
+    #--------------------------------------------#
+    #       Private Methods
+    #--------------------------------------------#
+
+    def _advance(self, now: float) -> None:
+        """ Integrates the last value up to now, evicting the buckets that leave the window. """
+        if self._last_time is None:
+            self._bucket = floor(now / self._bucket_width)
+            self._last_time = now
+            return
+
+        if now - self._last_time > self._bucket_width * self._bucket_count:
+            self._clear()
+            self._bucket = floor(now / self._bucket_width) - self._bucket_count + 1
+            self._last_time = self._bucket * self._bucket_width
+
+        while self._last_time < now:
+            bucket_end = (self._bucket + 1) * self._bucket_width
+            end = min(now, bucket_end)
+
+            if self._last_value is not None:
+                index = self._bucket % self._bucket_count
+                self._areas[index] += self._last_value * (end - self._last_time)
+                self._durations[index] += end - self._last_time
+                self._total_area += self._last_value * (end - self._last_time)
+                self._total_duration += end - self._last_time
+
+            self._last_time = end
+
+            if end >= bucket_end:
+                self._evict(self._bucket + 1)
+
+    def _clear(self) -> None:
+        """ Clears all buckets. """
+        for index in range(self._bucket_count):
+            self._areas[index] = 0.0
+            self._durations[index] = 0.0
+
+        self._total_area = 0
+        self._total_duration = 0
+
+    def _evict(self, bucket: int) -> None:
+        """ Moves to the bucket, subtracting the values it held one window ago. The totals are recomputed once per rotation to bound floating-point drift. """
+        index = bucket % self._bucket_count
+        self._total_area -= self._areas[index]
+        self._total_duration -= self._durations[index]
+        self._areas[index] = 0.0
+        self._durations[index] = 0.0
+        self._bucket = bucket
+
+        if index == 0:
+            self._total_area = fsum(self._areas)
+            self._total_duration = fsum(self._durations)
@@ -0,0 +1,167 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from __future__ import annotations
+from pathlib import Path
+import sys
+import unittest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.matjak_areas.utils.accumulator import MA_Accumulator, parse_value
+from homeassistant.const import CONF_UNIT_OF_MEASUREMENT, UnitOfTemperature
+from homeassistant.core import State
+from homeassistant.util.unit_conversion import TemperatureConverter
+
+
+#-----------------------------------------------------------#
+#       Tests
+#-----------------------------------------------------------#
+
+class TestAccumulator(unittest.TestCase):
+    """ Tests the running sum of MA_Accumulator. """
+
+    #--------------------------------------------#
+    #       Setup
+    #--------------------------------------------#
+
+    def setUp(self) -> None:
+        """ Creates the source states. """
+        self.states: dict[str, State] = {}
+        self._set_state("sensor.a", "1")
+        self._set_state("sensor.b", "2")
+        self._set_state("sensor.c", "unavailable")
+
+
+    #--------------------------------------------#
+    #       Tests
+    #--------------------------------------------#
+
+    def test_parse_value(self) -> None:
+        """ Only finite numeric states are parsed. """
+        self.assertEqual(parse_value(State("sensor.a", "1.5")), 1.5)
+        self.assertIsNone(parse_value(State("sensor.a", "nan")))
+        self.assertIsNone(parse_value(State("sensor.a", "on")))
+        self.assertIsNone(parse_value(None))
+
+    def test_reconcile_applies_only_changed_values(self) -> None:
+        """ Reconciling restored values applies only the values that differ from the current states. """
+        accumulator = MA_Accumulator()
+        accumulator.restore({ "sensor.a": 1, "sensor.b": 5, "sensor.gone": 7 })
+
+        changes = accumulator.reconcile(["sensor.a", "sensor.b", "sensor.c"], self.states.get)
+
+        self.assertEqual(changes, 1)
+        self.assertEqual(accumulator.values, { "sensor.a": 1, "sensor.b": 2 })
+        self.assertEqual(accumulator.sum, 3)
+
+    def test_reconcile_without_changes(self) -> None:
+        """ Reconciling values that match the current states changes nothing. """
+        accumulator = MA_Accumulator()
+        accumulator.reset(["sensor.a", "sensor.b"], self.states.get)
+
+        self.assertEqual(accumulator.reconcile(["sensor.a", "sensor.b"], self.states.get), 0)
+        self.assertEqual(accumulator.sum, 3)
+
+    def test_reset_skips_non_numeric_states(self) -> None:
+        """ Resetting reads only the numeric states. """
+        accumulator = MA_Accumulator()
+        accumulator.reset(["sensor.a", "sensor.b", "sensor.c", "sensor.missing"], self.states.get)
+
+        self.assertEqual(accumulator.count, 2)
+        self.assertEqual(accumulator.sum, 3)
+        self.assertEqual(accumulator.mean, 1.5)
+
+    def test_resync_bounds_drift(self) -> None:
+        """ The sum is recomputed every resync interval updates. """
+        accumulator = MA_Accumulator(resync_interval=10)
+
+        for index in range(1000):
+            accumulator.update("sensor.a", State("sensor.a", str(0.1 * (index % 7))))
+            accumulator.update("sensor.b", State("sensor.b", "0.3"))
+
+        self.assertAlmostEqual(accumulator.sum, sum(accumulator.values.values()), places=12)
+
+    def test_update_and_remove(self) -> None:
+        """ Updates replace the value of a source, and non-numeric states or removals drop it. """
+        accumulator = MA_Accumulator()
+        accumulator.reset(["sensor.a", "sensor.b"], self.states.get)
+
+        accumulator.update("sensor.a", State("sensor.a", "4"))
+        self.assertEqual(accumulator.sum, 6)
+
+        accumulator.update("sensor.b", State("sensor.b", "unknown"))
+        self.assertEqual(accumulator.values, { "sensor.a": 4 })
+
+        accumulator.remove(["sensor.a"])
+        self.assertEqual(accumulator.count, 0)
+        self.assertEqual(accumulator.sum, 0)
+        self.assertIsNone(accumulator.mean)
+
+    def test_update_converts_units(self) -> None:
+        """ Values are normalized into the unit of the converter, dropping values in unknown units. """
+        accumulator = MA_Accumulator(converter=TemperatureConverter)
+        accumulator.update("sensor.a", State("sensor.a", "212", { CONF_UNIT_OF_MEASUREMENT: UnitOfTemperature.FAHRENHEIT }))
+        accumulator.update("sensor.b", State("sensor.b", "20", { CONF_UNIT_OF_MEASUREMENT: UnitOfTemperature.CELSIUS }))
+        accumulator.update("sensor.c", State("sensor.c", "20", { CONF_UNIT_OF_MEASUREMENT: "%" }))
+
+        self.assertEqual(accumulator.unit, UnitOfTemperature.CELSIUS)
+        self.assertAlmostEqual(accumulator.values["sensor.a"], 100)
+        self.assertEqual(accumulator.sum, accumulator.values["sensor.a"] + 20)
+        self.assertNotIn("sensor.c", accumulator.values)
+
+
+    #--------------------------------------------#
+    #       Helpers
+    #--------------------------------------------#
+
+    def _set_state(self, entity_id: str, state: str) -> None:
+        """ Sets the state of a source. """
+        self.states[entity_id] = State(entity_id, state)
+
+
+class TestOrderedAccumulator(unittest.TestCase):
+    """ Tests the order statistics of an ordered MA_Accumulator. """
+
+    #--------------------------------------------#
+    #       Tests
+    #--------------------------------------------#
+
+    def test_empty(self) -> None:
+        """ An empty accumulator has no order statistics. """
+        accumulator = MA_Accumulator(ordered=True)
+
+        self.assertIsNone(accumulator.min)
+        self.assertIsNone(accumulator.max)
+        self.assertIsNone(accumulator.get_percentile(50))
+
+    def test_order_statistics_follow_updates(self) -> None:
+        """ The sorted list follows replaced and removed values, including duplicates. """
+        accumulator = MA_Accumulator(ordered=True)
+
+        for entity_id, value in [("sensor.a", "3"), ("sensor.b", "1"), ("sensor.c", "3"), ("sensor.d", "7")]:
+            accumulator.update(entity_id, State(entity_id, value))
+
+        self.assertEqual((accumulator.min, accumulator.max), (1, 7))
+        self.assertEqual(accumulator.get_percentile(50), 3)
+
+        accumulator.update("sensor.d", State("sensor.d", "0"))
+        accumulator.remove(["sensor.a"])
+
+        self.assertEqual((accumulator.min, accumulator.max), (0, 3))
+        self.assertEqual(accumulator.get_percentile(50), 1)
+
+    def test_percentile_interpolates(self) -> None:
+        """ Percentiles interpolate linearly between the closest ranks. """
+        accumulator = MA_Accumulator(ordered=True)
+        accumulator.restore({ "sensor.a": 10, "sensor.b": 20, "sensor.c": 30, "sensor.d": 40 })
+
+        self.assertEqual(accumulator.get_percentile(0), 10)
+        self.assertEqual(accumulator.get_percentile(50), 25)
+        self.assertAlmostEqual(accumulator.get_percentile(90), 37)
+        self.assertEqual(accumulator.get_percentile(100), 40)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from __future__ import annotations
+from pathlib import Path
+import operator
+import sys
+import unittest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.matjak_areas.utils.predicate import MA_StatePredicate, parse_rule
+from homeassistant.core import State
+
+
+#-----------------------------------------------------------#
+#       Tests
+#-----------------------------------------------------------#
+
+class TestParseRule(unittest.TestCase):
+    """ Tests the rule parsing of the predicate. """
+
+    #--------------------------------------------#
+    #       Tests
+    #--------------------------------------------#
+
+    def test_conditions(self) -> None:
+        """ Conditions are parsed into attribute, operator and a numeric or string value. """
+        domain, state, conditions = parse_rule("media_player: playing & volume_level > 0 & source == 'TV'")
+
+        self.assertEqual((domain, state), ("media_player", "playing"))
+        self.assertEqual(conditions, (("volume_level", operator.gt, 0.0), ("source", operator.eq, "TV")))
+
+    def test_invalid_rules(self) -> None:
+        """ Rules without a state or domain, or with malformed conditions, are rejected. """
+        for rule in ["", ": on", "person:", "on & volume", "on & volume ~ 1"]:
+            with self.subTest(rule=rule):
+                with self.assertRaises(ValueError):
+                    parse_rule(rule)
+
+    def test_state_only(self) -> None:
+        """ A rule without a domain applies to any domain. """
+        self.assertEqual(parse_rule(" on "), (None, "on", ()))
+        self.assertEqual(parse_rule("person: home"), ("person", "home", ()))
+
+
+class TestStatePredicate(unittest.TestCase):
+    """ Tests the matching of MA_StatePredicate. """
+
+    #--------------------------------------------#
+    #       Setup
+    #--------------------------------------------#
+
+    def setUp(self) -> None:
+        """ Compiles the rules. """
+        self.predicate = MA_StatePredicate(["on", "person: home", "media_player: playing & volume_level > 0", "idle & source == TV"])
+
+
+    #--------------------------------------------#
+    #       Tests
+    #--------------------------------------------#
+
+    def test_any_domain_conditions(self) -> None:
+        """ Conditions of rules without a domain apply to any domain. """
+        self.assertTrue(self.predicate.matches("media_player.tv", State("media_player.tv", "idle", { "source": "TV" })))
+        self.assertFalse(self.predicate.matches("media_player.tv", State("media_player.tv", "idle", { "source": "HDMI" })))
+
+    def test_any_domain_states(self) -> None:
+        """ States of rules without a domain match any domain. """
+        self.assertTrue(self.predicate.matches("binary_sensor.motion", State("binary_sensor.motion", "on")))
+        self.assertTrue(self.predicate.matches("light.lamp", State("light.lamp", "on")))
+        self.assertFalse(self.predicate.matches("light.lamp", State("light.lamp", "off")))
+        self.assertFalse(self.predicate.matches("light.lamp", None))
+
+    def test_conditions(self) -> None:
+        """ All conditions have to hold, and missing or incomparable attributes never match. """
+        self.assertTrue(self.predicate.matches("media_player.tv", State("media_player.tv", "playing", { "volume_level": 0.4 })))
+        self.assertFalse(self.predicate.matches("media_player.tv", State("media_player.tv", "playing", { "volume_level": 0 })))
+        self.assertFalse(self.predicate.matches("media_player.tv", State("media_player.tv", "playing")))
+        self.assertFalse(self.predicate.matches("media_player.tv", State("media_player.tv", "playing", { "volume_level": "loud" })))
+
+    def test_domain_states(self) -> None:
+        """ States of rules with a domain only match that domain. """
+        self.assertTrue(self.predicate.matches("person.bob", State("person.bob", "home")))
+        self.assertFalse(self.predicate.matches("device_tracker.phone", State("device_tracker.phone", "home")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from __future__ import annotations
+from pathlib import Path
+import asyncio
+import sys
+import unittest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+
+from custom_components.matjak_areas.utils import registry as ma_registry
+from custom_components.matjak_areas.utils.slicer import MA_Slicer
+from hass_stub import patch_registries, StubConfigEntry, StubHomeAssistant, StubRegistryEntry
+
+
+#-----------------------------------------------------------#
+#       Constants
+#-----------------------------------------------------------#
+
+AREA = "living_room"
+OTHER_AREA = "hallway"
+
+DISABLED_ENTITY_IDS = ["binary_sensor.motion_2", "binary_sensor.motion_3", "binary_sensor.motion_4"]
+ENABLED_ENTITY_IDS = ["binary_sensor.motion_1", "binary_sensor.motion_5"]
+INCLUDED_ENTITY_ID = "binary_sensor.hallway_motion"
+
+
+#-----------------------------------------------------------#
+#       Tests
+#-----------------------------------------------------------#
+
+class TestRegistryEntityConfig(unittest.IsolatedAsyncioTestCase):
+    """ Tests the entity configuration processing of MA_Registry. """
+
+    #--------------------------------------------#
+    #       Setup
+    #--------------------------------------------#
+
+    async def asyncSetUp(self) -> None:
+        """ Creates a registry over an area with adjacent disabled entities between enabled ones. """
+        self._patch = patch_registries()
+        self._patch.__enter__()
+        self.hass = StubHomeAssistant(asyncio.get_running_loop())
+
+        for entity_id in sorted(ENABLED_ENTITY_IDS + DISABLED_ENTITY_IDS):
+            disabled_by = "user" if entity_id in DISABLED_ENTITY_IDS else None
+            self._add_entity(entity_id, AREA, disabled_by)
+
+        self._add_entity(INCLUDED_ENTITY_ID, OTHER_AREA)
+        self.config_entry = StubConfigEntry("entry", "Living Room", { "areas": [AREA], "entities": { "include_entities": [INCLUDED_ENTITY_ID] } })
+        ma_registry.create_registry(self.hass, self.config_entry)
+        self.registry = ma_registry.get_registry(self.config_entry)
+
+    async def asyncTearDown(self) -> None:
+        """ Removes the registry and restores the registry helpers. """
+        ma_registry.remove_registry(self.config_entry)
+        await self.hass.async_block_till_done()
+        self._patch.__exit__(None, None, None)
+
+
+    #--------------------------------------------#
+    #       Tests
+    #--------------------------------------------#
+
+    async def test_async_update_entities_drops_adjacent_disabled_entities(self) -> None:
+        """ The sliced rebuild drops every disabled entity, keeping the enabled neighbours and included entities. """
+        await self.registry.async_update_entities(MA_Slicer(ma_registry.REBUILD_SLICE_TIME))
+        self._assert_entities()
+
+    async def test_update_entities_drops_adjacent_disabled_entities(self) -> None:
+        """ The rebuild drops every disabled entity, keeping the enabled neighbours and included entities. """
+        self.registry.update_entities()
+        self._assert_entities()
+
+    async def test_update_entities_drops_disabled_included_entity(self) -> None:
+        """ An included entity is dropped once it is disabled. """
+        self.hass.entity_registry.entities[INCLUDED_ENTITY_ID].disabled_by = "user"
+        self.registry.update_entities()
+        self.assertNotIn(INCLUDED_ENTITY_ID, self.registry.entities)
+
+
+    #--------------------------------------------#
+    #       Helpers
+    #--------------------------------------------#
+
+    def _add_entity(self, entity_id: str, area_id: str, disabled_by: str = None) -> None:
+        """ Adds an entity to the stand-in registry. """
+        self.hass.entity_registry.entities[entity_id] = StubRegistryEntry(entity_id, area_id=area_id, config_entry_id="stub", disabled_by=disabled_by, original_device_class="motion")
+        self.hass.states.async_set(entity_id, "off", { "device_class": "motion" })
+
+    def _assert_entities(self) -> None:
+        """ Asserts that the disabled entities are dropped and the others are tracked. """
+        for entity_id in DISABLED_ENTITY_IDS:
+            self.assertNotIn(entity_id, self.registry.entities)
+
+        for entity_id in ENABLED_ENTITY_IDS + [INCLUDED_ENTITY_ID]:
+            self.assertIn(entity_id, self.registry.entities)
+
+
+if __name__ == "__main__":
+    unittest.main()
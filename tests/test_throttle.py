@@ -0,0 +1,74 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from __future__ import annotations
+from pathlib import Path
+import sys
+import unittest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.matjak_areas.utils.throttle import MA_Throttle
+
+
+#-----------------------------------------------------------#
+#       Tests
+#-----------------------------------------------------------#
+
+class TestThrottle(unittest.TestCase):
+    """ Tests the publish decisions of MA_Throttle. """
+
+    #--------------------------------------------#
+    #       Tests
+    #--------------------------------------------#
+
+    def test_disabled_publishes_every_change(self) -> None:
+        """ A throttle without thresholds or interval publishes every change immediately. """
+        throttle = MA_Throttle()
+        throttle.mark_published(10, 0)
+
+        self.assertEqual(throttle.get_delay(10.1, 0), 0)
+        self.assertIsNone(throttle.get_delay(10, 0))
+
+    def test_insignificant_change_waits_for_max_staleness(self) -> None:
+        """ A change below the thresholds is published once the published value is older than the max staleness, and never without one. """
+        throttle = MA_Throttle(min_interval=5, absolute_threshold=1, max_staleness=60)
+        throttle.mark_published(10, 100)
+
+        self.assertEqual(throttle.get_delay(10.5, 110), 50)
+        self.assertEqual(throttle.get_delay(10.5, 170), 0)
+
+        throttle = MA_Throttle(absolute_threshold=1)
+        throttle.mark_published(10, 100)
+        self.assertIsNone(throttle.get_delay(10.5, 1000))
+
+    def test_non_numeric_values_publish_immediately(self) -> None:
+        """ Changes to or from a non-numeric value are published immediately. """
+        throttle = MA_Throttle(min_interval=60, absolute_threshold=100)
+        throttle.mark_published(None, 0)
+        self.assertEqual(throttle.get_delay(10, 1), 0)
+
+        throttle.mark_published(10, 1)
+        self.assertEqual(throttle.get_delay(None, 2), 0)
+
+    def test_relative_threshold(self) -> None:
+        """ A change has to exceed the relative threshold to be significant. """
+        throttle = MA_Throttle(relative_threshold=10)
+        throttle.mark_published(200, 0)
+
+        self.assertIsNone(throttle.get_delay(210, 1))
+        self.assertEqual(throttle.get_delay(220, 1), 0)
+
+    def test_significant_change_waits_for_min_interval(self) -> None:
+        """ A significant change is delayed until the min interval has passed since the last publish. """
+        throttle = MA_Throttle(min_interval=10, absolute_threshold=1)
+        throttle.mark_published(10, 100)
+
+        self.assertEqual(throttle.get_delay(12, 104), 6)
+        self.assertEqual(throttle.get_delay(12, 110), 0)
+        self.assertEqual(throttle.published_value, 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
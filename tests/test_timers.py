@@ -0,0 +1,92 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from __future__ import annotations
+from pathlib import Path
+import asyncio
+import sys
+import unittest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+
+from custom_components.matjak_areas.utils.timers import get_key, MA_Timers
+from hass_stub import StubHomeAssistant
+
+
+#-----------------------------------------------------------#
+#       Tests
+#-----------------------------------------------------------#
+
+class TestTimers(unittest.IsolatedAsyncioTestCase):
+    """ Tests the shared timer heap. """
+
+    #--------------------------------------------#
+    #       Setup
+    #--------------------------------------------#
+
+    async def asyncSetUp(self) -> None:
+        """ Creates the timers on the running loop. """
+        self.hass = StubHomeAssistant(asyncio.get_running_loop())
+        self.timers = MA_Timers(self.hass)
+        self.fired: dict[str, float] = {}
+
+
+    #--------------------------------------------#
+    #       Tests
+    #--------------------------------------------#
+
+    async def test_cancel(self) -> None:
+        """ A cancelled timer does not fire. """
+        self.timers.schedule("a", 0.01, self._record("a"))
+        self.timers.cancel("a")
+        await asyncio.sleep(0.05)
+        self.assertEqual(self.fired, {})
+        self.assertEqual(self.timers.pending_count, 0)
+
+    async def test_pending_count_per_namespace(self) -> None:
+        """ Pending timers are counted per namespace. """
+        self.timers.schedule(get_key("clear", "a"), 10, self._record("a"))
+        self.timers.schedule(get_key("clear", "b"), 10, self._record("b"))
+        self.timers.schedule(get_key("other", "a"), 10, self._record("c"))
+        self.assertEqual(self.timers.get_pending_count("clear"), 2)
+        self.assertEqual(self.timers.pending_count, 3)
+
+    async def test_reschedule_from_callback_does_not_delay_pending_timers(self) -> None:
+        """ A callback scheduling a later timer does not delay a pending timer that is due earlier. """
+        start = self.hass.loop.time()
+
+        def on_a() -> None:
+            self._record("a")()
+            self.timers.schedule("c", 1, self._record("c"))
+
+        self.timers.schedule("a", 0.01, on_a)
+        self.timers.schedule("b", 0.05, self._record("b"))
+        await asyncio.sleep(0.2)
+
+        self.assertIn("b", self.fired)
+        self.assertLess(self.fired["b"] - start, 0.2)
+        self.assertNotIn("c", self.fired)
+        self.assertTrue(self.timers.is_scheduled("c"))
+        self.timers.cancel("c")
+
+    async def test_schedule_replaces_pending_timer(self) -> None:
+        """ Scheduling a key again replaces its pending timer. """
+        self.timers.schedule("a", 0.01, self._record("first"))
+        self.timers.schedule("a", 0.02, self._record("second"))
+        await asyncio.sleep(0.05)
+        self.assertEqual(set(self.fired), { "second" })
+
+
+    #--------------------------------------------#
+    #       Helpers
+    #--------------------------------------------#
+
+    def _record(self, name: str):
+        """ Gets a callback recording the time it was called at. """
+        return lambda: self.fired.setdefault(name, self.hass.loop.time())
+
+
+if __name__ == "__main__":
+    unittest.main()
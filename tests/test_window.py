@@ -0,0 +1,80 @@
+#-----------------------------------------------------------#
+#       Imports
+#-----------------------------------------------------------#
+
+from __future__ import annotations
+from pathlib import Path
+import sys
+import unittest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.matjak_areas.utils.window import MA_TimeWindow
+
+
+#-----------------------------------------------------------#
+#       Tests
+#-----------------------------------------------------------#
+
+class TestTimeWindow(unittest.TestCase):
+    """ Tests the time-weighted average of MA_TimeWindow. """
+
+    #--------------------------------------------#
+    #       Tests
+    #--------------------------------------------#
+
+    def test_average_is_time_weighted(self) -> None:
+        """ Each value is weighted by the time it held. """
+        window = MA_TimeWindow(60, bucket_count=6)
+        window.add(10, 0)
+        window.add(40, 30)
+
+        self.assertEqual(window.get_average(40), 17.5)
+
+    def test_evicts_old_buckets(self) -> None:
+        """ Values leave the average once their buckets leave the window, which covers the current bucket and the previous ones. """
+        window = MA_TimeWindow(60, bucket_count=6)
+        window.add(10, 0)
+        window.add(40, 60)
+
+        self.assertAlmostEqual(window.get_average(90), (10 * 20 + 40 * 30) / 50)
+        self.assertAlmostEqual(window.get_average(120), 40)
+
+    def test_gap_longer_than_window(self) -> None:
+        """ A gap longer than the window leaves only the last value in the average. """
+        window = MA_TimeWindow(60, bucket_count=6)
+        window.add(10, 0)
+        window.add(20, 5)
+
+        self.assertAlmostEqual(window.get_average(1000), 20)
+
+    def test_last_value_before_coverage(self) -> None:
+        """ The last value is used until time has been covered, and None without any value. """
+        window = MA_TimeWindow(60)
+
+        self.assertIsNone(window.get_average(0))
+
+        window.add(5, 0)
+        self.assertEqual(window.get_average(0), 5)
+
+    def test_none_is_not_covered(self) -> None:
+        """ Time without a value does not count towards the average. """
+        window = MA_TimeWindow(60, bucket_count=6)
+        window.add(10, 0)
+        window.add(None, 10)
+        window.add(20, 40)
+
+        self.assertAlmostEqual(window.get_average(50), 15)
+
+    def test_totals_stay_consistent_over_rotations(self) -> None:
+        """ The incremental totals match the buckets after many rotations. """
+        window = MA_TimeWindow(60, bucket_count=6)
+
+        for second in range(0, 1000, 3):
+            window.add(second % 11, second)
+
+        self.assertAlmostEqual(window.get_average(1000), sum(window._areas) / sum(window._durations))
+
+
+if __name__ == "__main__":
+    unittest.main()